@@ -2,6 +2,7 @@
 
 import asyncio
 from collections.abc import Callable
+from typing import cast
 
 from meld.data_models import AdvisorResult, ProviderErrorType
 from meld.prompts import ADVISOR_PROMPT
@@ -61,21 +62,18 @@ class AdvisorPool:
             *tasks, return_exceptions=True
         )
 
-        # Convert exceptions to failed results
-        processed: list[AdvisorResult] = []
+        # Convert exceptions to failed results in place; the common
+        # all-success case returns the gathered list unmodified
         for i, result in enumerate(results):
             if isinstance(result, BaseException):
-                processed.append(
-                    AdvisorResult(
-                        provider=self._adapters[i].name,
-                        success=False,
-                        round_number=round_number,
-                    )
+                results[i] = AdvisorResult(
+                    provider=self._adapters[i].name,
+                    success=False,
+                    round_number=round_number,
                 )
-            else:
-                processed.append(result)
 
-        return processed
+        # The loop above replaced every exception with an AdvisorResult
+        return cast(list[AdvisorResult], results)
 
     async def _invoke_with_retry(
         self,
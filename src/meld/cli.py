@@ -3,7 +3,7 @@
 import argparse
 import shlex
 import sys
-from typing import NoReturn
+from typing import IO, NoReturn
 
 from meld import __version__
 
@@ -63,8 +63,15 @@ def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--skip-preflight", action="store_true", help="Skip environment checks")
 
 
-def get_task_input(args: argparse.Namespace) -> str:
-    """Get task input from arguments, file, or stdin."""
+def get_task_input(args: argparse.Namespace, stdin: IO[str] | None = None) -> str:
+    """Get task input from arguments, file, or stdin.
+
+    The stream is injectable so callers (and tests) can supply any
+    file-like object; it defaults to sys.stdin.
+    """
+    if stdin is None:
+        stdin = sys.stdin
+
     if args.task:
         return str(args.task)
 
@@ -72,8 +79,8 @@ def get_task_input(args: argparse.Namespace) -> str:
         with open(args.file) as f:
             return f.read().strip()
 
-    if not sys.stdin.isatty():
-        return sys.stdin.read().strip()
+    if not stdin.isatty():
+        return stdin.read().strip()
 
     raise ValueError("No task provided. Use positional arg, --file, or pipe via stdin.")
 
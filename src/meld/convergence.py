@@ -1,10 +1,33 @@
 """Convergence detection logic."""
 
 import difflib
+import functools
+import hashlib
+from collections import deque
 
 from meld.data_models import ConvergenceAssessment, ConvergenceStatus
 
 
+@functools.lru_cache(maxsize=512)
+def _diff_ratio(old_plan: str, new_plan: str) -> float:
+    """Memoized line-diff ratio for a (non-identical) plan pair.
+
+    SequenceMatcher is quadratic; convergence checks and oscillation
+    rounds often revisit the same plan pair, so results are cached on
+    the string pair itself.
+    """
+    old_lines = old_plan.splitlines()
+    new_lines = new_plan.splitlines()
+
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    # quick_ratio() is an O(n) upper bound on ratio(); if plans share
+    # almost no lines the exact diff can't change any threshold decision
+    quick = matcher.quick_ratio()
+    if quick < 0.1:
+        return 1.0 - quick
+    return 1.0 - matcher.ratio()
+
+
 class ConvergenceDetector:
     """Detects when plan has converged using hybrid approach."""
 
@@ -21,31 +44,35 @@ class ConvergenceDetector:
         """
         self._diff_threshold = diff_threshold
         self._min_rounds = min_rounds
-        self._plan_history: list[str] = []
+        # Fixed-size digests instead of full plan strings: bounded memory
+        # regardless of plan size, and oscillation checks become digest
+        # comparisons
+        self._plan_history: deque[bytes] = deque(maxlen=6)
 
     def add_plan(self, plan: str) -> None:
-        """Add a plan to history for oscillation detection."""
-        self._plan_history.append(plan)
+        """Add a plan digest to history for oscillation detection."""
+        self._plan_history.append(
+            hashlib.blake2b(plan.encode(), digest_size=16).digest()
+        )
 
     def calculate_diff_ratio(self, old_plan: str, new_plan: str) -> float:
-        """Calculate the ratio of changes between two plans."""
-        old_lines = old_plan.splitlines()
-        new_lines = new_plan.splitlines()
+        """Calculate the ratio of changes between two plans.
 
-        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
-        return 1.0 - matcher.ratio()
+        Identical plans (the common converged case) short-circuit before
+        any diffing; non-identical pairs go through a memoized helper
+        so repeated comparisons of the same plans skip the diff.
+        """
+        if old_plan is new_plan or old_plan == new_plan:
+            return 0.0
+        return _diff_ratio(old_plan, new_plan)
 
     def detect_oscillation(self) -> bool:
         """Detect if plan is oscillating (A -> B -> A pattern)."""
         if len(self._plan_history) < 3:
             return False
 
-        # Check if current plan is similar to one from 2 rounds ago
-        current = self._plan_history[-1]
-        two_ago = self._plan_history[-3]
-
-        diff = self.calculate_diff_ratio(current, two_ago)
-        return diff < 0.02  # Less than 2% difference = essentially same
+        # Current plan matching the one from 2 rounds ago means we cycled back
+        return self._plan_history[-1] == self._plan_history[-3]
 
     def check_convergence(
         self,
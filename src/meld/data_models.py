@@ -2,20 +2,30 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntFlag, auto
 from typing import Any
 
 
-class ProviderErrorType(Enum):
-    """Categorized error types for provider failures."""
+class ProviderErrorType(IntFlag):
+    """Categorized error types for provider failures.
 
-    CLI_NOT_FOUND = "cli_not_found"
-    AUTH_FAILED = "auth_failed"
-    TIMEOUT = "timeout"
-    RATE_LIMITED = "rate_limited"
-    NETWORK_ERROR = "network_error"
-    PARSE_ERROR = "parse_error"
-    UNKNOWN = "unknown"
+    IntFlag with power-of-two values so error types collected from an
+    advisor pool can be aggregated into a single bitmask with O(1)
+    membership tests. Use :attr:`label` where a string is needed.
+    """
+
+    CLI_NOT_FOUND = auto()
+    AUTH_FAILED = auto()
+    TIMEOUT = auto()
+    RATE_LIMITED = auto()
+    NETWORK_ERROR = auto()
+    PARSE_ERROR = auto()
+    UNKNOWN = auto()
+
+    @property
+    def label(self) -> str:
+        """Human-readable label (e.g. 'auth_failed')."""
+        return self.name.lower() if self.name else str(self.value)
 
 
 class AdvisorStatus(Enum):
@@ -38,7 +48,7 @@ class ConvergenceStatus(Enum):
     NEEDS_HUMAN = "needs_human"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProviderError:
     """Error from a provider adapter."""
 
@@ -50,7 +60,7 @@ class ProviderError:
     retryable: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AdvisorResult:
     """Result from an advisor invocation."""
 
@@ -73,7 +83,7 @@ class StreamEvent:
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConvergenceAssessment:
     """Assessment of plan convergence."""
 
@@ -8,8 +8,20 @@ from meld.data_models import AdvisorResult, ConvergenceAssessment, ConvergenceSt
 from meld.prompts import INITIAL_PLAN_PROMPT, SYNTHESIS_PROMPT
 from meld.providers import ClaudeAdapter
 
-
-@dataclass
+# Extraction patterns, compiled once at import instead of re-consulting
+# the re cache on every synthesis round
+_PLAN_RE = re.compile(
+    r"(?:## Plan|# Plan|## Updated Plan|# Updated Plan)\s*\n(.*?)(?=\n## |\n# |\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+_CONVERGENCE_JSON_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+_DECISION_LOG_RE = re.compile(
+    r"(?:## Decision Log|# Decision Log)\s*\n(.*?)(?=\n## |\n# |\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class MelderResult:
     """Result from melder operation."""
 
@@ -89,11 +101,7 @@ class Melder:
     def _extract_plan(self, output: str) -> str:
         """Extract the plan content from melder output."""
         # Look for plan section markers
-        plan_match = re.search(
-            r"(?:## Plan|# Plan|## Updated Plan|# Updated Plan)\s*\n(.*?)(?=\n## |\n# |\Z)",
-            output,
-            re.DOTALL | re.IGNORECASE,
-        )
+        plan_match = _PLAN_RE.search(output)
         if plan_match:
             return plan_match.group(1).strip()
 
@@ -103,7 +111,7 @@ class Melder:
     def _extract_convergence(self, output: str) -> ConvergenceAssessment | None:
         """Extract convergence assessment from melder output."""
         # Look for JSON convergence block
-        json_match = re.search(r"```json\s*(\{.*?\})\s*```", output, re.DOTALL)
+        json_match = _CONVERGENCE_JSON_RE.search(output)
         if json_match:
             try:
                 data = json.loads(json_match.group(1))
@@ -134,11 +142,7 @@ class Melder:
 
     def _extract_decision_log(self, output: str) -> str:
         """Extract decision log from melder output."""
-        log_match = re.search(
-            r"(?:## Decision Log|# Decision Log)\s*\n(.*?)(?=\n## |\n# |\Z)",
-            output,
-            re.DOTALL | re.IGNORECASE,
-        )
+        log_match = _DECISION_LOG_RE.search(output)
         if log_match:
             return log_match.group(1).strip()
         return ""
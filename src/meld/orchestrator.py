@@ -1,5 +1,6 @@
 """Orchestrator for the meld convergence loop."""
 
+import difflib
 import signal
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -54,8 +55,20 @@ class Orchestrator:
         skip_preflight: bool = False,
         tui_controller: "TUIController | None" = None,
         on_event: EventCallback | None = None,
+        convergence_epsilon: float = 0.0,
+        stability_window: int = 1,
     ) -> None:
-        """Initialize the orchestrator."""
+        """Initialize the orchestrator.
+
+        convergence_epsilon, when positive, enables an early stop: the
+        loop exits once the fractional change between successive plans
+        falls to epsilon or below, even if the melder's assessment says
+        CONTINUING. Each skipped round saves a full advisor fan-out.
+
+        stability_window sets how many consecutive CONVERGED rounds are
+        required before the loop terminates; values above 1 trade extra
+        rounds for protection against a single false-positive signal.
+        """
         self._task = task
         self._prd_context = self._load_prd(prd_path) if prd_path else None
         self._max_rounds = max_rounds
@@ -65,6 +78,9 @@ class Orchestrator:
         self._quiet = quiet
         self._verbose = verbose
         self._skip_preflight = skip_preflight
+        self._convergence_epsilon = convergence_epsilon
+        self._stability_window = stability_window
+        self._converged_streak = 0
 
         self._session = SessionManager(
             task=task,
@@ -238,23 +254,46 @@ class Orchestrator:
                 round_num,
             )
 
+            # Early stop: a fractional change at or below epsilon means
+            # further advisor rounds can't pay for themselves
+            early_stop = False
+            if self._convergence_epsilon > 0.0:
+                change_ratio = 1.0 - difflib.SequenceMatcher(
+                    None, current_plan, synthesis.plan
+                ).quick_ratio()
+                early_stop = change_ratio <= self._convergence_epsilon
+
+            # Append-only rounds reuse the previous snapshot's bytes
+            if synthesis.plan.startswith(current_plan):
+                self._session.write_plan_delta(synthesis.plan, round_num, current_plan)
+            else:
+                self._session.write_plan(synthesis.plan, round_num)
             current_plan = synthesis.plan
-            self._session.write_plan(current_plan, round_num)
 
             self._emit_event("melder_complete", content=current_plan)
 
-            if convergence.status == ConvergenceStatus.CONVERGED:
+            if convergence.status == ConvergenceStatus.CONVERGED or early_stop:
+                self._converged_streak += 1
+                if self._converged_streak >= self._stability_window:
+                    if not self._quiet:
+                        print("✓ Plan converged!")
+                    converged = True
+                    self._emit_event("converged")
+                    self._emit_event("phase_changed", phase="Converged", round=round_num)
+                    break
+                # Not stable yet: run another round to confirm
                 if not self._quiet:
-                    print("✓ Plan converged!")
-                converged = True
-                self._emit_event("converged")
-                self._emit_event("phase_changed", phase="Converged", round=round_num)
-                break
+                    print(
+                        f"Converged signal {self._converged_streak}/"
+                        f"{self._stability_window}, confirming..."
+                    )
+                continue
             elif convergence.status == ConvergenceStatus.OSCILLATING:
                 if not self._quiet:
                     print("⚠ Plan oscillating - needs human decision")
                 break
 
+            self._converged_streak = 0
             if not self._quiet:
                 print(f"Changes: {convergence.changes_made}, Open items: {convergence.open_items}")
 
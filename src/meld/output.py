@@ -6,6 +6,9 @@ from typing import Any
 from meld import __version__
 from meld.data_models import SessionMetadata
 
+# Footer rendered once at import; both markdown formatters append it
+_FOOTER = f"Generated by Meld v{__version__}"
+
 
 class OutputFormatter:
     """Formats meld output in various formats."""
@@ -93,7 +96,7 @@ class OutputFormatter:
 
         lines.extend([
             "---",
-            f"Generated by Meld v{__version__}",
+            _FOOTER,
         ])
 
         return "\n".join(lines)
@@ -172,7 +175,7 @@ class OutputFormatter:
 
         lines.extend([
             "---",
-            f"Generated by Meld v{__version__}",
+            _FOOTER,
         ])
 
         return "\n".join(lines)
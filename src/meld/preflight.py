@@ -1,11 +1,16 @@
 """Preflight checks and diagnostics."""
 
 import asyncio
+import functools
+import os
 import shutil
 from dataclasses import dataclass, field
 
 from meld.providers import ClaudeAdapter, GeminiAdapter, OpenAIAdapter, ProviderAdapter
 
+# Canonical provider names, in display order
+_PROVIDERS: tuple[str, ...] = ("claude", "gemini", "openai")
+
 # Install instructions per provider
 INSTALL_INSTRUCTIONS: dict[str, str] = {
     "claude": "npm install -g @anthropic-ai/claude-code",
@@ -51,17 +56,33 @@ class PreflightResult:
     available_advisors: list[str] = field(default_factory=list)
 
 
+@functools.lru_cache(maxsize=64)
+def _which_cached(command: str, path: str) -> str | None:
+    """shutil.which with the PATH scan memoized.
+
+    Keyed on the PATH value so the cache self-invalidates if the
+    environment changes; doctor and preflight re-checks otherwise
+    repeat the same directory stats.
+    """
+    return shutil.which(command, path=path)
+
+
 def check_cli_exists(command: str) -> bool:
     """Check if a CLI command exists on PATH."""
-    return shutil.which(command) is not None
+    return _which_cached(command, os.environ.get("PATH", "")) is not None
 
 
 def get_cli_path(command: str) -> str:
     """Get the full path to a CLI command."""
-    path = shutil.which(command)
+    path = _which_cached(command, os.environ.get("PATH", ""))
     return path if path else ""
 
 
+# Version probes should be near-instant; a CLI that takes longer than
+# this is hung and gets killed rather than stalling preflight
+VERSION_PROBE_TIMEOUT = 2.0
+
+
 async def get_cli_version(adapter: ProviderAdapter) -> str:
     """Get the version of a CLI tool."""
     if not adapter.is_available():
@@ -74,7 +95,14 @@ async def get_cli_version(adapter: ProviderAdapter) -> str:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
+        try:
+            stdout, _ = await asyncio.wait_for(
+                proc.communicate(), timeout=VERSION_PROBE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return ""
         if proc.returncode == 0:
             # Extract version from output (usually first line or number)
             output = stdout.decode().strip()
@@ -87,18 +115,24 @@ async def get_cli_version(adapter: ProviderAdapter) -> str:
 
 async def check_provider(adapter: ProviderAdapter) -> ProviderCheckResult:
     """Run preflight checks for a provider."""
+    # One cached PATH lookup yields both existence and location;
+    # adapter.is_available() would repeat the same scan uncached
+    cli_path = get_cli_path(adapter.cli_command)
     result = ProviderCheckResult(
         provider=adapter.name,
-        cli_found=adapter.is_available(),
+        cli_found=bool(cli_path),
+        cli_path=cli_path,
     )
 
     if not result.cli_found:
         result.error = f"CLI '{adapter.cli_command}' not found on PATH"
         return result
-
-    result.cli_path = get_cli_path(adapter.cli_command)
-    result.version = await get_cli_version(adapter)
-    result.auth_valid = await adapter.check_auth()
+    # Version and auth probes are independent subprocesses; run them
+    # concurrently so each provider costs one probe's latency, not two
+    result.version, result.auth_valid = await asyncio.gather(
+        get_cli_version(adapter),
+        adapter.check_auth(),
+    )
 
     if result.auth_valid:
         result.auth_status = "authenticated"
@@ -136,7 +170,7 @@ async def run_preflight(skip: bool = False) -> PreflightResult:
     if skip:
         return PreflightResult(
             passed=True,
-            available_advisors=["claude", "gemini", "openai"],
+            available_advisors=list(_PROVIDERS),
         )
 
     check_results = await run_preflight_checks()
@@ -162,7 +196,7 @@ async def run_preflight(skip: bool = False) -> PreflightResult:
     # Determine if we pass based on available advisors
     # 1 missing: warn but continue
     # 2+ missing: error and stop
-    missing_count = 3 - len(available)
+    missing_count = len(_PROVIDERS) - len(available)
 
     if missing_count >= 2:
         passed = False
@@ -227,9 +261,9 @@ def run_doctor() -> int:
         print()
 
     # Summary
-    print(f"Summary: {available_count}/3 advisors available")
+    print(f"Summary: {available_count}/{len(_PROVIDERS)} advisors available")
 
-    if available_count == 3:
+    if available_count == len(_PROVIDERS):
         print("All providers ready!")
         return 0
     elif available_count >= 1:
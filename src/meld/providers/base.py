@@ -1,12 +1,30 @@
 """Base provider adapter interface."""
 
 import asyncio
+import re
 import shutil
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 
 from meld.data_models import AdvisorResult, ProviderError, ProviderErrorType, StreamEvent
 
+# Fallback error classification: one alternation with a named group
+# per category classifies stderr in a single pass. The leftmost hit
+# wins; alternation order favors auth on ties.
+_ERROR_RE = re.compile(
+    r"(?P<auth>auth|unauthorized|api key)"
+    r"|(?P<rate>rate limit|quota)"
+    r"|(?P<network>network|connection)",
+    re.IGNORECASE,
+)
+
+# (error type, message, retryable) keyed by named group
+_ERROR_CATEGORIES = {
+    "auth": (ProviderErrorType.AUTH_FAILED, "Authentication failed", False),
+    "rate": (ProviderErrorType.RATE_LIMITED, "Rate limited", True),
+    "network": (ProviderErrorType.NETWORK_ERROR, "Network error", True),
+}
+
 
 class ProviderAdapter(ABC):
     """Abstract base class for provider adapters."""
@@ -148,32 +166,17 @@ class ProviderAdapter(ABC):
 
     def _classify_error(self, stderr: str) -> ProviderError:
         """Classify an error based on stderr output."""
-        stderr_lower = stderr.lower()
-
-        if "auth" in stderr_lower or "unauthorized" in stderr_lower or "api key" in stderr_lower:
-            return ProviderError(
-                error_type=ProviderErrorType.AUTH_FAILED,
-                message="Authentication failed",
-                provider=self.name,
-                details={"stderr": stderr},
-            )
-
-        if "rate limit" in stderr_lower or "quota" in stderr_lower:
-            return ProviderError(
-                error_type=ProviderErrorType.RATE_LIMITED,
-                message="Rate limited",
-                provider=self.name,
-                details={"stderr": stderr},
-                retryable=True,
-            )
-
-        if "network" in stderr_lower or "connection" in stderr_lower:
+        match = _ERROR_RE.search(stderr)
+        if match:
+            group = match.lastgroup
+            assert group is not None  # every alternation branch is named
+            error_type, message, retryable = _ERROR_CATEGORIES[group]
             return ProviderError(
-                error_type=ProviderErrorType.NETWORK_ERROR,
-                message="Network error",
+                error_type=error_type,
+                message=message,
                 provider=self.name,
                 details={"stderr": stderr},
-                retryable=True,
+                retryable=retryable,
             )
 
         return ProviderError(
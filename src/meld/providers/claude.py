@@ -28,29 +28,24 @@ class ClaudeAdapter(ProviderAdapter):
     - Opus model by default
     """
 
-    # Claude-specific error patterns
-    AUTH_PATTERNS = [
-        re.compile(r"not logged in", re.IGNORECASE),
-        re.compile(r"authentication required", re.IGNORECASE),
-        re.compile(r"unauthorized", re.IGNORECASE),
-        re.compile(r"invalid.*api.?key", re.IGNORECASE),
-        re.compile(r"please run.*auth", re.IGNORECASE),
-    ]
-
-    RATE_LIMIT_PATTERNS = [
-        re.compile(r"rate.?limit", re.IGNORECASE),
-        re.compile(r"quota.?exceeded", re.IGNORECASE),
-        re.compile(r"too many requests", re.IGNORECASE),
-        re.compile(r"429", re.IGNORECASE),
-    ]
-
-    NETWORK_PATTERNS = [
-        re.compile(r"connection.?refused", re.IGNORECASE),
-        re.compile(r"network.?unreachable", re.IGNORECASE),
-        re.compile(r"dns.*failed", re.IGNORECASE),
-        re.compile(r"could not resolve", re.IGNORECASE),
-        re.compile(r"ECONNREFUSED", re.IGNORECASE),
-    ]
+    # Claude-specific error patterns: one alternation with a named
+    # group per category classifies stderr in a single pass. The
+    # leftmost hit wins; alternation order favors auth on ties.
+    ERROR_PATTERN = re.compile(
+        r"(?P<auth>not logged in|authentication required|unauthorized"
+        r"|invalid.*api.?key|please run.*auth)"
+        r"|(?P<rate>rate.?limit|quota.?exceeded|too many requests|429)"
+        r"|(?P<network>connection.?refused|network.?unreachable|dns.*failed"
+        r"|could not resolve|ECONNREFUSED)",
+        re.IGNORECASE,
+    )
+
+    # (error type, message, retryable) keyed by named group
+    _ERROR_CATEGORIES = {
+        "auth": (ProviderErrorType.AUTH_FAILED, "Claude CLI authentication failed", False),
+        "rate": (ProviderErrorType.RATE_LIMITED, "Claude API rate limited", True),
+        "network": (ProviderErrorType.NETWORK_ERROR, "Network error connecting to Claude", True),
+    }
 
     def __init__(self, timeout: int = 600, model: str = "opus") -> None:
         """Initialize Claude adapter.
@@ -61,6 +56,20 @@ class ClaudeAdapter(ProviderAdapter):
         """
         super().__init__(timeout=timeout)
         self.model = model
+        # Static command tokens, assembled once; build_command only
+        # splices in the prompt
+        self._cmd_prefix = (
+            self.cli_command,
+            "-p",  # Prompt mode (non-interactive)
+        )
+        self._cmd_suffix = (
+            "--permission-mode",
+            "plan",  # Read-only mode
+            "--model",
+            model,
+            "--output-format",
+            "text",  # Plain text output
+        )
 
     @property
     def name(self) -> str:
@@ -76,17 +85,7 @@ class ClaudeAdapter(ProviderAdapter):
         Returns command like:
             claude -p "{prompt}" --permission-mode plan --model opus --output-format text
         """
-        return [
-            self.cli_command,
-            "-p",  # Prompt mode (non-interactive)
-            prompt,
-            "--permission-mode",
-            "plan",  # Read-only mode
-            "--model",
-            self.model,
-            "--output-format",
-            "text",  # Plain text output
-        ]
+        return [*self._cmd_prefix, prompt, *self._cmd_suffix]
 
     async def check_auth(self) -> bool:
         """Check if Claude CLI is authenticated.
@@ -110,37 +109,18 @@ class ClaudeAdapter(ProviderAdapter):
 
         Uses regex patterns to identify error types from stderr output.
         """
-        # Check auth patterns first
-        for pattern in self.AUTH_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.AUTH_FAILED,
-                    message="Claude CLI authentication failed",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                )
-
-        # Check rate limit patterns
-        for pattern in self.RATE_LIMIT_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.RATE_LIMITED,
-                    message="Claude API rate limited",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                    retryable=True,
-                )
-
-        # Check network patterns
-        for pattern in self.NETWORK_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.NETWORK_ERROR,
-                    message="Network error connecting to Claude",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                    retryable=True,
-                )
+        match = self.ERROR_PATTERN.search(stderr)
+        if match:
+            group = match.lastgroup
+            assert group is not None  # every alternation branch is named
+            error_type, message, retryable = self._ERROR_CATEGORIES[group]
+            return ProviderError(
+                error_type=error_type,
+                message=message,
+                provider=self.name,
+                details={"stderr": stderr},
+                retryable=retryable,
+            )
 
         # Fall back to base classification
         return super()._classify_error(stderr)
@@ -26,31 +26,24 @@ class GeminiAdapter(ProviderAdapter):
     - gemini-2.5-pro model by default
     """
 
-    # Gemini-specific error patterns
-    AUTH_PATTERNS = [
-        re.compile(r"not authenticated", re.IGNORECASE),
-        re.compile(r"invalid.*credentials", re.IGNORECASE),
-        re.compile(r"unauthorized", re.IGNORECASE),
-        re.compile(r"UNAUTHENTICATED", re.IGNORECASE),
-        re.compile(r"api.?key.*invalid", re.IGNORECASE),
-        re.compile(r"permission.?denied", re.IGNORECASE),
-    ]
-
-    RATE_LIMIT_PATTERNS = [
-        re.compile(r"rate.?limit", re.IGNORECASE),
-        re.compile(r"quota.?exceeded", re.IGNORECASE),
-        re.compile(r"resource.?exhausted", re.IGNORECASE),
-        re.compile(r"RESOURCE_EXHAUSTED", re.IGNORECASE),
-        re.compile(r"429", re.IGNORECASE),
-    ]
-
-    NETWORK_PATTERNS = [
-        re.compile(r"connection.*refused", re.IGNORECASE),
-        re.compile(r"network.*error", re.IGNORECASE),
-        re.compile(r"UNAVAILABLE", re.IGNORECASE),
-        re.compile(r"could not resolve", re.IGNORECASE),
-        re.compile(r"deadline.?exceeded", re.IGNORECASE),
-    ]
+    # Gemini-specific error patterns: one alternation with a named
+    # group per category classifies stderr in a single pass. The
+    # leftmost hit wins; alternation order favors auth on ties.
+    ERROR_PATTERN = re.compile(
+        r"(?P<auth>not authenticated|invalid.*credentials|unauthorized"
+        r"|UNAUTHENTICATED|api.?key.*invalid|permission.?denied)"
+        r"|(?P<rate>rate.?limit|quota.?exceeded|resource.?exhausted|429)"
+        r"|(?P<network>connection.*refused|network.*error|UNAVAILABLE"
+        r"|could not resolve|deadline.?exceeded)",
+        re.IGNORECASE,
+    )
+
+    # (error type, message, retryable) keyed by named group
+    _ERROR_CATEGORIES = {
+        "auth": (ProviderErrorType.AUTH_FAILED, "Gemini CLI authentication failed", False),
+        "rate": (ProviderErrorType.RATE_LIMITED, "Gemini API rate limited", True),
+        "network": (ProviderErrorType.NETWORK_ERROR, "Network error connecting to Gemini", True),
+    }
 
     def __init__(self, timeout: int = 600, model: str = "gemini-2.5-pro") -> None:
         """Initialize Gemini adapter.
@@ -61,6 +54,17 @@ class GeminiAdapter(ProviderAdapter):
         """
         super().__init__(timeout=timeout)
         self.model = model
+        # Static command tokens, assembled once; build_command only
+        # splices in the prompt
+        self._cmd_prefix = (
+            self.cli_command,
+            "-p",  # Prompt mode
+        )
+        self._cmd_suffix = (
+            "-m",  # Model selection
+            model,
+            "--sandbox",  # Read-only mode
+        )
 
     @property
     def name(self) -> str:
@@ -76,14 +80,7 @@ class GeminiAdapter(ProviderAdapter):
         Returns command like:
             gemini -p "{prompt}" -m gemini-2.5-pro --sandbox
         """
-        return [
-            self.cli_command,
-            "-p",  # Prompt mode
-            prompt,
-            "-m",  # Model selection
-            self.model,
-            "--sandbox",  # Read-only mode
-        ]
+        return [*self._cmd_prefix, prompt, *self._cmd_suffix]
 
     async def check_auth(self) -> bool:
         """Check if Gemini CLI is authenticated.
@@ -107,37 +104,18 @@ class GeminiAdapter(ProviderAdapter):
 
         Uses regex patterns to identify error types from stderr output.
         """
-        # Check auth patterns first
-        for pattern in self.AUTH_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.AUTH_FAILED,
-                    message="Gemini CLI authentication failed",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                )
-
-        # Check rate limit patterns
-        for pattern in self.RATE_LIMIT_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.RATE_LIMITED,
-                    message="Gemini API rate limited",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                    retryable=True,
-                )
-
-        # Check network patterns
-        for pattern in self.NETWORK_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.NETWORK_ERROR,
-                    message="Network error connecting to Gemini",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                    retryable=True,
-                )
+        match = self.ERROR_PATTERN.search(stderr)
+        if match:
+            group = match.lastgroup
+            assert group is not None  # every alternation branch is named
+            error_type, message, retryable = self._ERROR_CATEGORIES[group]
+            return ProviderError(
+                error_type=error_type,
+                message=message,
+                provider=self.name,
+                details={"stderr": stderr},
+                retryable=retryable,
+            )
 
         # Fall back to base classification
         return super()._classify_error(stderr)
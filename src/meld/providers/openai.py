@@ -12,6 +12,7 @@ Error patterns:
 """
 
 import asyncio
+import functools
 import re
 import shutil
 
@@ -19,6 +20,16 @@ from meld.data_models import ProviderError, ProviderErrorType
 from meld.providers.base import ProviderAdapter
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_cli(name: str) -> str | None:
+    """Resolve a CLI binary on PATH once per process.
+
+    shutil.which stats every PATH entry; the result cannot change
+    mid-run, so cache it instead of re-walking PATH per adapter.
+    """
+    return shutil.which(name)
+
+
 class OpenAIAdapter(ProviderAdapter):
     """Adapter for the OpenAI CLI (codex or chatgpt).
 
@@ -28,30 +39,25 @@ class OpenAIAdapter(ProviderAdapter):
     - Uses `exec` subcommand for codex
     """
 
-    # OpenAI-specific error patterns
-    AUTH_PATTERNS = [
-        re.compile(r"invalid.*api.?key", re.IGNORECASE),
-        re.compile(r"unauthorized", re.IGNORECASE),
-        re.compile(r"authentication.*failed", re.IGNORECASE),
-        re.compile(r"OPENAI_API_KEY.*not set", re.IGNORECASE),
-        re.compile(r"401", re.IGNORECASE),
-    ]
-
-    RATE_LIMIT_PATTERNS = [
-        re.compile(r"rate.?limit", re.IGNORECASE),
-        re.compile(r"too many requests", re.IGNORECASE),
-        re.compile(r"429", re.IGNORECASE),
-        re.compile(r"quota.*exceeded", re.IGNORECASE),
-        re.compile(r"insufficient.*quota", re.IGNORECASE),
-    ]
-
-    NETWORK_PATTERNS = [
-        re.compile(r"connection.*refused", re.IGNORECASE),
-        re.compile(r"network.*error", re.IGNORECASE),
-        re.compile(r"ECONNREFUSED", re.IGNORECASE),
-        re.compile(r"timeout", re.IGNORECASE),
-        re.compile(r"could not resolve", re.IGNORECASE),
-    ]
+    # OpenAI-specific error patterns: one alternation with a named
+    # group per category classifies stderr in a single pass. The
+    # leftmost hit wins; alternation order favors auth on ties.
+    ERROR_PATTERN = re.compile(
+        r"(?P<auth>invalid.*api.?key|unauthorized|authentication.*failed"
+        r"|OPENAI_API_KEY.*not set|401)"
+        r"|(?P<rate>rate.?limit|too many requests|429|quota.*exceeded"
+        r"|insufficient.*quota)"
+        r"|(?P<network>connection.*refused|network.*error|ECONNREFUSED"
+        r"|timeout|could not resolve)",
+        re.IGNORECASE,
+    )
+
+    # (error type, message, retryable) keyed by named group
+    _ERROR_CATEGORIES = {
+        "auth": (ProviderErrorType.AUTH_FAILED, "OpenAI CLI authentication failed", False),
+        "rate": (ProviderErrorType.RATE_LIMITED, "OpenAI API rate limited", True),
+        "network": (ProviderErrorType.NETWORK_ERROR, "Network error connecting to OpenAI", True),
+    }
 
     def __init__(self, timeout: int = 600, model: str = "gpt-5.2") -> None:
         """Initialize OpenAI adapter.
@@ -63,6 +69,10 @@ class OpenAIAdapter(ProviderAdapter):
         super().__init__(timeout=timeout)
         self.model = model
         self._cli_command: str | None = None
+        # Assembled lazily alongside CLI resolution; build_command
+        # only splices in the prompt afterwards
+        self._cmd_prefix: tuple[str, ...] | None = None
+        self._cmd_suffix: tuple[str, ...] = ()
 
     @property
     def name(self) -> str:
@@ -73,7 +83,7 @@ class OpenAIAdapter(ProviderAdapter):
         """Get CLI command, preferring codex over chatgpt."""
         if self._cli_command is None:
             # Try codex first, fall back to chatgpt
-            if shutil.which("codex"):
+            if _resolve_cli("codex"):
                 self._cli_command = "codex"
             else:
                 self._cli_command = "chatgpt"
@@ -88,24 +98,23 @@ class OpenAIAdapter(ProviderAdapter):
         For chatgpt (fallback):
             chatgpt "{prompt}" --model gpt-5.2
         """
-        cmd = self.cli_command
-        if cmd == "codex":
-            return [
-                cmd,
-                "exec",  # Execution subcommand
-                prompt,
-                "--sandbox",
-                "read-only",  # Read-only protection
-                "--model",
-                self.model,
-            ]
-        # Fallback for chatgpt CLI
-        return [
-            cmd,
-            prompt,
-            "--model",
-            self.model,
-        ]
+        if self._cmd_prefix is None:
+            if self.cli_command == "codex":
+                self._cmd_prefix = (
+                    self.cli_command,
+                    "exec",  # Execution subcommand
+                )
+                self._cmd_suffix = (
+                    "--sandbox",
+                    "read-only",  # Read-only protection
+                    "--model",
+                    self.model,
+                )
+            else:
+                # Fallback for chatgpt CLI
+                self._cmd_prefix = (self.cli_command,)
+                self._cmd_suffix = ("--model", self.model)
+        return [*self._cmd_prefix, prompt, *self._cmd_suffix]
 
     async def check_auth(self) -> bool:
         """Check if OpenAI CLI is authenticated.
@@ -129,37 +138,18 @@ class OpenAIAdapter(ProviderAdapter):
 
         Uses regex patterns to identify error types from stderr output.
         """
-        # Check auth patterns first
-        for pattern in self.AUTH_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.AUTH_FAILED,
-                    message="OpenAI CLI authentication failed",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                )
-
-        # Check rate limit patterns
-        for pattern in self.RATE_LIMIT_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.RATE_LIMITED,
-                    message="OpenAI API rate limited",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                    retryable=True,
-                )
-
-        # Check network patterns
-        for pattern in self.NETWORK_PATTERNS:
-            if pattern.search(stderr):
-                return ProviderError(
-                    error_type=ProviderErrorType.NETWORK_ERROR,
-                    message="Network error connecting to OpenAI",
-                    provider=self.name,
-                    details={"stderr": stderr},
-                    retryable=True,
-                )
+        match = self.ERROR_PATTERN.search(stderr)
+        if match:
+            group = match.lastgroup
+            assert group is not None  # every alternation branch is named
+            error_type, message, retryable = self._ERROR_CATEGORIES[group]
+            return ProviderError(
+                error_type=error_type,
+                message=message,
+                provider=self.name,
+                details={"stderr": stderr},
+                retryable=retryable,
+            )
 
         # Fall back to base classification
         return super()._classify_error(stderr)
@@ -1,31 +1,137 @@
 """Session management and persistence."""
 
+import hashlib
+import itertools
 import json
+import mmap
 import os
 import re
-import tempfile
-import uuid
+import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from meld.data_models import SessionMetadata
 
+try:
+    # orjson is a C serializer; much faster than stdlib json on the hot
+    # metadata persistence path. Fall back to stdlib on platforms
+    # without wheels.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps_indented(data: dict[str, Any]) -> str | bytes:
+    """Serialize a dict to indented JSON, using orjson when available.
+
+    Returns orjson's bytes as-is so callers can write them without a
+    decode/re-encode round-trip; stdlib fallback returns str.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=str)
+
+
+def _dumps_compact(data: dict[str, Any]) -> bytes:
+    """Serialize a dict to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode()
+
+
+def _loads(raw: bytes | str | memoryview) -> Any:
+    """Deserialize JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, memoryview):  # pragma: no cover - stdlib fallback
+        raw = raw.tobytes()
+    return json.loads(raw)
+
+
+def _read_json_file(path: Path) -> Any:
+    """Read and parse a JSON file.
+
+    Files larger than a page are memory-mapped so parsing reads straight
+    from the page cache instead of copying into an intermediate buffer.
+    Sub-page files gain nothing from mmap and use a plain read.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > mmap.PAGESIZE:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                # orjson accepts a buffer via memoryview (zero-copy);
+                # stdlib json needs bytes
+                return _loads(memoryview(mm) if orjson is not None else mm[:])
+        return _loads(os.read(fd, size))
+    finally:
+        os.close(fd)
+
+
+# Second-granularity ISO prefix cache for event timestamps: events in
+# the same second reuse the strftime result and only format the
+# microsecond suffix
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _iso_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string without a datetime object."""
+    global _TS_CACHE
+    sec, ns_rem = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE = (sec, prefix)
+    return f"{prefix}.{ns_rem // 1000:06d}"
+
+
+# Common secret patterns folded into one alternation, compiled once at
+# import; a single pass visits each byte once instead of once per
+# pattern. Named groups select the placeholder on match.
+_SECRET_RE = re.compile(
+    r"(?P<sk_key>sk-[a-zA-Z0-9]{20,})"
+    r"|(?P<api_key>api[_-]?key['\"]?\s*[:=]\s*['\"]?[a-zA-Z0-9-_]{20,})"
+    r"|(?P<token>token['\"]?\s*[:=]\s*['\"]?[a-zA-Z0-9-_]{20,})"
+    r"|(?P<password>password['\"]?\s*[:=]\s*['\"]?[^\s'\"]{8,})",
+    re.IGNORECASE,
+)
+
+_SECRET_REPLACEMENTS = {
+    "sk_key": "[REDACTED_API_KEY]",
+    "api_key": "[REDACTED_API_KEY]",
+    "token": "[REDACTED_TOKEN]",
+    "password": "[REDACTED_PASSWORD]",
+}
+
+
+def _redact_match(match: "re.Match[str]") -> str:
+    """Replacement callback: pick the placeholder for the matched group."""
+    return _SECRET_REPLACEMENTS[match.lastgroup]  # type: ignore[index]
+
 
 class SessionManager:
     """Manages session state and artifact persistence."""
 
-    # Common secret patterns to redact
-    SECRET_PATTERNS = [
-        (r"sk-[a-zA-Z0-9]{20,}", "[REDACTED_API_KEY]"),
-        (r"api[_-]?key['\"]?\s*[:=]\s*['\"]?[a-zA-Z0-9-_]{20,}", "[REDACTED_API_KEY]"),
-        (r"token['\"]?\s*[:=]\s*['\"]?[a-zA-Z0-9-_]{20,}", "[REDACTED_TOKEN]"),
-        (r"password['\"]?\s*[:=]\s*['\"]?[^\s'\"]{8,}", "[REDACTED_PASSWORD]"),
-    ]
+    # Substrings that must appear (case-insensitively) for the secret
+    # pattern above to match; checked with C-level str containment
+    # before the regex engine runs
+    _SECRET_SENTINELS = ("sk-", "key", "token", "password")
 
     # Directory permissions for session directories
     DIR_PERMISSIONS = 0o755
 
+    # Live instances keyed by session path so same-process resume can skip
+    # re-reading metadata and re-hashing artifacts. Weak values mean the
+    # cache never extends an instance's lifetime.
+    _instance_cache: "weakref.WeakValueDictionary[str, SessionManager]" = (
+        weakref.WeakValueDictionary()
+    )
+
     def __init__(
         self,
         task: str,
@@ -33,21 +139,48 @@ class SessionManager:
         no_save: bool = False,
         prd_path: str | None = None,
         resume_id: str | None = None,
+        buffered: bool = False,
     ) -> None:
-        """Initialize session manager."""
+        """Initialize session manager.
+
+        When ``buffered`` is True, artifact writes are staged in memory and
+        only hit disk on :meth:`flush` (called automatically from
+        ``mark_complete`` and ``mark_interrupted``). This trades per-round
+        crash durability for fewer write syscalls on long runs.
+        """
         self._no_save = no_save
+        self._buffered = buffered
+        self._dirty = False
+        self._events_fp: IO[bytes] | None = None
+        self._pending_writes: list[tuple[str, str]] = []
+        self._plan_scan_cache: tuple[int, tuple[int, str] | None] | None = None
+        self._artifact_hashes: dict[str, str] = {}
         self._run_dir = Path(run_dir)
         self._current_round = 0
         self._interrupted_at: datetime | None = None
         self._advisor_statuses: dict[str, str] = {}
+        # Providers whose feedback artifact exists, per round; maintained
+        # inline on writes so checkpoint queries need no directory scan,
+        # and filled lazily from disk for resumed sessions
+        self._feedback_by_round: dict[int, set[str]] = {}
         self._convergence_info: dict[str, Any] = {}
 
         if resume_id:
             self._session_id = resume_id
             self._session_path = self._run_dir / resume_id
+
+            # Same-process resume: adopt the live instance's state and skip
+            # all filesystem reads
+            cached = SessionManager._instance_cache.get(str(self._session_path))
+            if cached is not None:
+                self.__dict__.update(cached.__dict__)
+                return
+
             self._metadata = self._load_metadata()
             # Restore additional state from loaded metadata
             self._current_round = self._metadata.rounds_completed
+            if not no_save:
+                self._load_artifact_hashes()
         else:
             self._session_id = self._generate_session_id()
             self._session_path = self._run_dir / self._session_id
@@ -59,7 +192,25 @@ class SessionManager:
 
         if not no_save:
             self._create_session_directory()
+            # Persist eagerly once so list_sessions and cross-process
+            # resume can discover the session before its first flush
             self._save_metadata()
+            self._persist_metadata()
+            # Long-lived append handle: events accumulate in the buffer
+            # and reach disk on flush() instead of one open/write/close
+            # cycle per event
+            self._events_fp = open(
+                self._session_path / "events.jsonl", "ab", buffering=64 * 1024
+            )
+            SessionManager._instance_cache[str(self._session_path)] = self
+        else:
+            # Specialize the I/O leaves to a shared no-op so no-save
+            # sessions skip redaction, digesting, and path work entirely
+            # instead of branching inside every call
+            self.write_artifact = self._noop_write  # type: ignore[method-assign]
+            self.write_json = self._noop_write  # type: ignore[method-assign]
+            self.append_event = self._noop_write  # type: ignore[method-assign]
+            self._save_metadata = self._noop_write  # type: ignore[method-assign]
 
     @property
     def session_id(self) -> str:
@@ -81,15 +232,32 @@ class SessionManager:
         """Get current round number."""
         return self._current_round
 
+    def metadata_snapshot(self) -> dict[str, Any]:
+        """Return the in-memory session metadata as a plain dict.
+
+        Lets callers assert on session state without re-reading and
+        re-parsing session.json from disk.
+        """
+        return asdict(self._metadata)
+
+    # Per-process counter for session-id suffixes; itertools.count is
+    # atomic in CPython so no lock is needed
+    _id_counter = itertools.count()
+
     def _generate_session_id(self) -> str:
         """Generate a unique session ID.
 
         Format: YYYYMMDD-HHMMSS-<8char hex>
         Example: 20260116-024717-abc12345
+
+        The suffix combines the pid with a monotonic counter: unique
+        across processes and within a process without drawing from
+        os.urandom per session. time.strftime formats the UTC timestamp
+        without constructing a datetime object first.
         """
-        timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-        short_uuid = uuid.uuid4().hex[:8]
-        return f"{timestamp}-{short_uuid}"
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+        suffix = f"{os.getpid() & 0xFFFF:04x}{next(SessionManager._id_counter) & 0xFFFF:04x}"
+        return f"{timestamp}-{suffix}"
 
     def _create_session_directory(self) -> None:
         """Create the session directory with proper permissions."""
@@ -101,8 +269,7 @@ class SessionManager:
         """Load metadata from existing session."""
         meta_path = self._session_path / "session.json"
         if meta_path.exists():
-            with open(meta_path) as f:
-                data = json.load(f)
+            data = _read_json_file(meta_path)
 
             # Load additional session state (not part of SessionMetadata)
             self._current_round = data.get("current_round", 0)
@@ -132,23 +299,64 @@ class SessionManager:
             return SessionMetadata(**metadata_fields)
         raise FileNotFoundError(f"Session not found: {self._session_id}")
 
+    @staticmethod
+    def _content_digest(content: str) -> str:
+        """Compute a short content digest used to skip redundant writes."""
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    def _load_artifact_hashes(self) -> None:
+        """Index existing artifacts by content digest on resume.
+
+        Allows resumed sessions to skip rewrites of artifacts whose
+        content has not changed.
+        """
+        file_digest = getattr(hashlib, "file_digest", None)  # 3.11+
+        for entry in os.scandir(self._session_path):
+            if not entry.is_file() or not entry.name.endswith(".md"):
+                continue
+            with open(entry.path, "rb") as f:
+                if file_digest is not None:
+                    digest = file_digest(
+                        f, lambda: hashlib.blake2b(digest_size=16)
+                    ).hexdigest()
+                else:
+                    digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            self._artifact_hashes[entry.name] = digest
+
+    @staticmethod
+    def _noop_write(*args: Any, **kwargs: Any) -> None:
+        """Stand-in bound over the I/O methods of no-save sessions."""
+        return None
+
     def redact_secrets(self, content: str) -> str:
         """Redact common secret patterns from content."""
-        for pattern, replacement in self.SECRET_PATTERNS:
-            content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
-        return content
-
-    def _atomic_write(self, path: Path, content: str) -> None:
-        """Write content to file atomically using temp file + rename."""
-        # Create temp file in same directory to ensure same filesystem
-        fd, temp_path = tempfile.mkstemp(
-            dir=str(path.parent),
-            prefix=f".{path.name}.",
-            suffix=".tmp",
-        )
+        # Most artifacts contain no secrets; skip the regex passes
+        # entirely when no sentinel substring is present
+        lowered = content.lower()
+        if not any(sentinel in lowered for sentinel in self._SECRET_SENTINELS):
+            return content
+        return _SECRET_RE.sub(_redact_match, content)
+
+    def _atomic_write(self, path: Path, content: str | bytes) -> None:
+        """Write content to file atomically using temp file + rename.
+
+        The temp file is a deterministic .<name>.tmp sibling (same
+        filesystem, so the rename stays atomic): each session directory
+        has a single writer, so mkstemp's random-name generation and
+        extra directory probing buy nothing here. Bytes go straight
+        through os.write on the raw fd; wrapping it in a buffered
+        TextIOWrapper would only add an encoder and an intermediate
+        buffer for content that is written exactly once.
+        """
+        temp_path = str(path.parent / f".{path.name}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            with os.fdopen(fd, "w") as f:
-                f.write(content)
+            data = memoryview(content.encode() if isinstance(content, str) else content)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             # Atomic rename
             os.replace(temp_path, path)
         except Exception:
@@ -158,7 +366,10 @@ class SessionManager:
             raise
 
     def write_artifact(self, filename: str, content: str, redact: bool = True) -> Path | None:
-        """Write an artifact to the session directory atomically."""
+        """Write an artifact to the session directory atomically.
+
+        In buffered mode the write is staged until the next flush().
+        """
         if self._no_save:
             return None
 
@@ -166,48 +377,108 @@ class SessionManager:
             content = self.redact_secrets(content)
 
         path = self._session_path / filename
-        self._atomic_write(path, content)
+
+        # Skip the write entirely when the content is unchanged
+        # (idempotent resume rewrites)
+        digest = self._content_digest(content)
+        if self._artifact_hashes.get(filename) == digest:
+            return path
+        self._artifact_hashes[filename] = digest
+
+        if self._buffered:
+            self._pending_writes.append((filename, content))
+        else:
+            self._atomic_write(path, content)
         return path
 
+    def flush(self) -> None:
+        """Write any buffered artifacts and dirty metadata to disk."""
+        for filename, content in self._pending_writes:
+            self._atomic_write(self._session_path / filename, content)
+        self._pending_writes.clear()
+        if self._events_fp is not None and not self._events_fp.closed:
+            self._events_fp.flush()
+        self._persist_metadata()
+
+    @contextmanager
+    def batch(self) -> "Iterator[SessionManager]":
+        """Coalesce artifact writes and metadata saves within a block.
+
+        write_* calls inside the block stage content in memory and the
+        per-call session.json rewrites are suppressed; on exit the staged
+        artifacts are written followed by a single metadata save.
+        """
+        if self._no_save:
+            yield self
+            return
+
+        prev_buffered = self._buffered
+        self._buffered = True
+        try:
+            yield self
+        finally:
+            self._buffered = prev_buffered
+            self.flush()
+
     def write_json(self, filename: str, data: dict[str, Any]) -> Path | None:
         """Write JSON data to the session directory atomically."""
         if self._no_save:
             return None
 
-        content = json.dumps(data, indent=2, default=str)
+        content = _dumps_indented(data)
         path = self._session_path / filename
         self._atomic_write(path, content)
         return path
 
     def append_event(self, event_type: str, **data: Any) -> None:
-        """Append an event to events.jsonl."""
-        if self._no_save:
+        """Append an event to events.jsonl.
+
+        Each line is independent, so a partially flushed log remains
+        parseable; flush() (and therefore mark_complete /
+        mark_interrupted) makes buffered events durable.
+        """
+        if self._no_save or self._events_fp is None:
             return
 
         event = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_timestamp(),
             "type": event_type,
             **data,
         }
-
-        events_path = self._session_path / "events.jsonl"
-        line = json.dumps(event, default=str) + "\n"
-
-        # Append mode is safe for crash recovery - each line is independent
-        with open(events_path, "a") as f:
-            f.write(line)
+        self._events_fp.write(_dumps_compact(event) + b"\n")
 
     def update_metadata(self, **kwargs: Any) -> None:
-        """Update session metadata."""
+        """Update session metadata.
+
+        The in-memory dataclass is authoritative; a changed field only
+        marks session.json dirty, to be persisted on the next flush.
+        """
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(self._metadata, key):
+            if hasattr(self._metadata, key) and getattr(self._metadata, key) != value:
                 setattr(self._metadata, key, value)
-        self._save_metadata()
+                changed = True
+        if changed:
+            self._save_metadata()
 
     def _save_metadata(self) -> None:
-        """Save metadata to session.json."""
-        if self._no_save:
+        """Mark session.json as needing a rewrite.
+
+        Actual serialization is deferred to _persist_metadata so N small
+        metadata updates per round coalesce into one write.
+        """
+        self._dirty = True
+
+    def _persist_metadata(self) -> None:
+        """Write dirty metadata to session.json.
+
+        Called from flush() — and therefore mark_complete,
+        mark_interrupted, and batch() exit — rather than from every
+        write_* call.
+        """
+        if self._no_save or not self._dirty:
             return
+        self._dirty = False
 
         data = {
             "id": self._metadata.session_id,
@@ -242,14 +513,62 @@ class SessionManager:
     def write_plan(self, plan: str, round_number: int) -> Path | None:
         """Write a plan snapshot for a specific round."""
         self._current_round = round_number
+        self._plan_scan_cache = None
         self.append_event("plan_written", round=round_number, length=len(plan))
         result = self.write_artifact(f"plan.round{round_number}.md", plan)
-        self._save_metadata()  # Update session.json with new current_round
+        self._save_metadata()  # Mark session.json dirty with new current_round
         return result
 
+    def write_plan_delta(self, plan: str, round_number: int, prev_plan: str) -> Path | None:
+        """Write a plan snapshot that extends the previous round's plan.
+
+        When the new plan is the previous plan plus an appended tail (the
+        common sequential-round case), the unchanged prefix is copied
+        kernel-side from the previous snapshot with os.sendfile and only
+        the tail bytes pass through Python. Falls back to write_plan when
+        the fast path does not apply.
+        """
+        if self._no_save:
+            return None
+
+        prev_path = self._session_path / f"plan.round{round_number - 1}.md"
+        if (
+            self._buffered
+            or not plan.startswith(prev_plan)
+            or not hasattr(os, "sendfile")
+            or not prev_path.exists()
+        ):
+            return self.write_plan(plan, round_number)
+
+        self._current_round = round_number
+        self._plan_scan_cache = None
+        self.append_event("plan_written", round=round_number, length=len(plan))
+
+        delta = self.redact_secrets(plan[len(prev_plan):])
+        path = self._session_path / f"plan.round{round_number}.md"
+        src_fd = os.open(prev_path, os.O_RDONLY)
+        try:
+            # Note: sendfile rejects O_APPEND destinations (EINVAL); the
+            # plain fd offset already advances past the copied prefix
+            dst_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.sendfile(dst_fd, src_fd, 0, os.fstat(src_fd).st_size)
+                os.write(dst_fd, delta.encode())
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        # The combined digest is not recomputed; drop any stale entry so a
+        # later full write is not incorrectly skipped.
+        self._artifact_hashes.pop(path.name, None)
+        self._save_metadata()
+        return path
+
     def write_advisor_feedback(self, provider: str, feedback: str, round_number: int) -> Path | None:
         """Write advisor feedback for a specific round."""
         self._advisor_statuses[provider] = "completed"
+        self._feedback_by_round.setdefault(round_number, set()).add(provider)
         self.append_event(
             "advisor_feedback",
             provider=provider,
@@ -257,7 +576,38 @@ class SessionManager:
             length=len(feedback),
         )
         result = self.write_artifact(f"advisor.{provider}.round{round_number}.md", feedback)
-        self._save_metadata()  # Update session.json with advisor status
+        self._save_metadata()  # Mark session.json dirty with advisor status
+        return result
+
+    def commit_round(
+        self,
+        round_number: int,
+        plan: str,
+        advisor_feedbacks: dict[str, str] | None = None,
+    ) -> Path | None:
+        """Persist a round's plan and advisor feedback in one transaction.
+
+        Fuses the per-artifact session.json rewrites that write_plan and
+        write_advisor_feedback would each perform into a single metadata
+        save per round.
+        """
+        self._current_round = round_number
+
+        for provider, feedback in (advisor_feedbacks or {}).items():
+            self._advisor_statuses[provider] = "completed"
+            self._feedback_by_round.setdefault(round_number, set()).add(provider)
+            self.append_event(
+                "advisor_feedback",
+                provider=provider,
+                round=round_number,
+                length=len(feedback),
+            )
+            self.write_artifact(f"advisor.{provider}.round{round_number}.md", feedback)
+
+        self._plan_scan_cache = None
+        self.append_event("plan_written", round=round_number, length=len(plan))
+        result = self.write_artifact(f"plan.round{round_number}.md", plan)
+        self._save_metadata()
         return result
 
     def update_advisor_status(self, provider: str, status: str) -> None:
@@ -289,7 +639,9 @@ class SessionManager:
     def write_final_plan(self, plan: str) -> Path | None:
         """Write the final converged plan."""
         self.append_event("final_plan_written", length=len(plan))
-        return self.write_artifact("final-plan.md", plan)
+        result = self.write_artifact("final-plan.md", plan)
+        self.flush()  # Final plan should always be durable immediately
+        return result
 
     def mark_complete(self, converged: bool, advisors: list[str]) -> None:
         """Mark the session as complete."""
@@ -305,12 +657,14 @@ class SessionManager:
             advisors_participated=advisors,
             status="complete",
         )
+        self.flush()
 
     def mark_interrupted(self) -> None:
         """Mark the session as interrupted."""
         self._interrupted_at = datetime.utcnow()
         self.append_event("session_interrupted", round=self._current_round)
         self.update_metadata(status="interrupted")
+        self.flush()
 
     def get_last_checkpoint(self) -> dict[str, Any]:
         """Get the last checkpoint for resume.
@@ -329,40 +683,95 @@ class SessionManager:
         }
 
         # Find the latest plan
-        plan_files = sorted(
-            self._session_path.glob("plan.round*.md"),
-            key=lambda p: int(p.stem.split("round")[1]),
-            reverse=True,
-        )
-        if plan_files:
-            checkpoint["last_plan_file"] = str(plan_files[0])
-            checkpoint["last_plan_round"] = int(plan_files[0].stem.split("round")[1])
-
-        # Find advisor feedback for current round
-        advisor_files = list(
-            self._session_path.glob(f"advisor.*.round{self._current_round}.md")
-        )
-        checkpoint["feedback_received"] = [
-            f.stem.split(".")[1] for f in advisor_files
-        ]
+        latest_plan = self._scan_latest_plan()
+        if latest_plan is not None:
+            round_num, name = latest_plan
+            checkpoint["last_plan_file"] = str(self._session_path / name)
+            checkpoint["last_plan_round"] = round_num
+
+        # Feedback for the current round comes from the in-memory index;
+        # a resumed session has no index yet and scans the directory once
+        # to seed it
+        providers = self._feedback_by_round.get(self._current_round)
+        if providers is None:
+            providers = self._scan_round_feedback(self._current_round)
+            self._feedback_by_round[self._current_round] = providers
+        checkpoint["feedback_received"] = sorted(providers)
 
         return checkpoint
 
+    def _scan_latest_plan(self) -> tuple[int, str] | None:
+        """Find the highest-numbered plan.roundN.md as (round, filename).
+
+        The scan is memoized on the session directory's mtime so
+        repeated checkpoint queries skip the readdir. The mtime alone is
+        not trusted for our own writes — coarse-granularity filesystems
+        can give a scan and a subsequent write the same tick — so the
+        plan-write paths also clear the cache explicitly.
+        """
+        try:
+            mtime_ns = os.stat(self._session_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        cached = self._plan_scan_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        latest: tuple[int, str] | None = None
+        with os.scandir(self._session_path) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("plan.round") and name.endswith(".md"):
+                    round_num = int(name[len("plan.round"):-3])
+                    if latest is None or round_num > latest[0]:
+                        latest = (round_num, name)
+
+        self._plan_scan_cache = (mtime_ns, latest)
+        return latest
+
+    def _scan_round_feedback(self, round_number: int) -> set[str]:
+        """Collect providers with a feedback artifact for the given round.
+
+        Plain prefix/suffix tests on scandir names instead of a glob,
+        which would compile an fnmatch regex and allocate a Path per
+        match.
+        """
+        suffix = f".round{round_number}.md"
+        providers: set[str] = set()
+        try:
+            with os.scandir(self._session_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("advisor.") and name.endswith(suffix):
+                        providers.add(name[len("advisor.") : -len(suffix)])
+        except FileNotFoundError:
+            pass
+        return providers
+
     @classmethod
     def list_sessions(cls, run_dir: str = ".meld/runs") -> list[dict[str, Any]]:
-        """List all sessions in the run directory."""
+        """List all sessions in the run directory.
+
+        os.scandir reuses the readdir dirent type, so directory checks
+        cost no extra stat; session.json reads are attempted directly
+        rather than probed with exists() first.
+        """
         sessions: list[dict[str, Any]] = []
-        run_path = Path(run_dir)
-        if not run_path.exists():
+        try:
+            it = os.scandir(run_dir)
+        except FileNotFoundError:
             return sessions
 
-        for session_dir in run_path.iterdir():
-            if not session_dir.is_dir():
-                continue
-            session_file = session_dir / "session.json"
-            if session_file.exists():
-                with open(session_file) as f:
-                    data = json.load(f)
-                sessions.append(data)
+        with it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                try:
+                    sessions.append(
+                        _read_json_file(Path(entry.path) / "session.json")
+                    )
+                except FileNotFoundError:
+                    continue
 
         return sorted(sessions, key=lambda s: s.get("started", ""), reverse=True)
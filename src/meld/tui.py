@@ -1,6 +1,8 @@
 """Terminal User Interface for meld using Textual."""
 
 import asyncio
+import io
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -48,15 +50,10 @@ class Phase(Enum):
     CONVERGED = "Converged"
 
 
-def _get_time() -> float:
-    """Get current time, handling missing event loop gracefully."""
-    try:
-        loop = asyncio.get_running_loop()
-        return loop.time()
-    except RuntimeError:
-        # No running event loop, use monotonic time
-        import time
-        return time.monotonic()
+# Integer nanoseconds from the vDSO: cheaper than a float time.time()
+# call per streamed chunk and immune to float rounding. Module-level
+# alias so tests can patch it.
+_get_time_ns = time.monotonic_ns
 
 
 @dataclass
@@ -67,39 +64,69 @@ class StreamBuffer:
     render thrashing during rapid streaming.
     """
 
-    content: str = ""
-    _pending: str = ""
-    _last_flush: float = field(default_factory=lambda: 0.0)
-    _min_interval: float = 1.0 / 60.0  # ~60fps max
+    # Flushed content accumulates in a StringIO so each flush appends
+    # without reallocating the full transcript; the joined string is
+    # cached until the next write
+    _content_io: io.StringIO = field(default_factory=io.StringIO)
+    _content_cache: str = ""
+    _cache_valid: bool = True
+    # Pending chunks stay unjoined until flush: append is O(1) instead
+    # of re-copying the accumulated string per streamed token
+    _pending: list[str] = field(default_factory=list)
+    _last_flush_ns: int = 0
+    _min_interval_ns: int = 1_000_000_000 // 60  # ~60fps max
+
+    @property
+    def content(self) -> str:
+        """All flushed content, materialized lazily."""
+        if not self._cache_valid:
+            self._content_cache = self._content_io.getvalue()
+            self._cache_valid = True
+        return self._content_cache
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content_io = io.StringIO()
+        self._content_io.write(value)
+        self._content_cache = value
+        self._cache_valid = True
+
+    @property
+    def pending(self) -> str:
+        """Pending content not yet flushed, joined on demand."""
+        return "".join(self._pending)
 
     def append(self, text: str) -> None:
         """Append text to the pending buffer."""
-        self._pending += text
+        self._pending.append(text)
 
     def flush(self) -> str | None:
         """Flush pending content if enough time has passed.
 
         Returns the full content if flushed, None otherwise.
         """
-        now = _get_time()
-        if self._pending and (now - self._last_flush) >= self._min_interval:
-            self.content += self._pending
-            self._pending = ""
-            self._last_flush = now
+        now = _get_time_ns()
+        if self._pending and (now - self._last_flush_ns) >= self._min_interval_ns:
+            self._content_io.write("".join(self._pending))
+            self._pending.clear()
+            self._cache_valid = False
+            self._last_flush_ns = now
             return self.content
         return None
 
     def force_flush(self) -> str:
         """Force flush all pending content."""
-        self.content += self._pending
-        self._pending = ""
-        self._last_flush = _get_time()
+        if self._pending:
+            self._content_io.write("".join(self._pending))
+            self._pending.clear()
+            self._cache_valid = False
+        self._last_flush_ns = _get_time_ns()
         return self.content
 
     def clear(self) -> None:
         """Clear all content."""
         self.content = ""
-        self._pending = ""
+        self._pending.clear()
 
 
 class MeldPanel(Static):
@@ -214,7 +241,7 @@ class MeldPanel(Static):
     def update_content(self, text: str) -> None:
         """Replace the panel content."""
         self._buffer.content = text
-        self._buffer._pending = ""
+        self._buffer._pending.clear()
         self.update(Text(text, no_wrap=False))
 
     def append_content(self, text: str) -> None:
@@ -230,6 +257,18 @@ class MeldPanel(Static):
         content = self._buffer.force_flush()
         self.update(Text(content, no_wrap=False))
 
+    def flush_pending(self) -> None:
+        """Render pending content whose earlier flush was throttled.
+
+        Without this, a chunk arriving just inside the throttle window
+        would not appear until the next chunk (or a force_update).
+        """
+        if not self._buffer._pending:
+            return
+        content = self._buffer.flush()
+        if content is not None:
+            self.update(Text(content, no_wrap=False))
+
     def set_status(self, status: PanelStatus, retry_count: int = 0) -> None:
         """Set the panel status."""
         self._retry_count = retry_count
@@ -273,7 +312,7 @@ class MeldPanel(Static):
         if not self._buffer.content and not self._buffer._pending:
             lines.append(Text("Waiting...", style="dim"))
         else:
-            lines.append(Text(self._buffer.content + self._buffer._pending, no_wrap=False))
+            lines.append(Text(self._buffer.content + self._buffer.pending, no_wrap=False))
 
         # Combine all lines
         result = Text()
@@ -462,11 +501,14 @@ class MeldApp(App[None]):
                 delta = datetime.utcnow() - self._session_start
                 self._status_bar.session_time = delta.total_seconds()
 
-            # Update panel timers
+            # Update panel timers and drain throttled stream content;
+            # reusing this tick avoids a separate timer per panel
             if self._melder_panel:
                 self._melder_panel.tick_elapsed()
+                self._melder_panel.flush_pending()
             for panel in self._advisor_panels.values():
                 panel.tick_elapsed()
+                panel.flush_pending()
 
     async def action_quit(self) -> None:
         """Handle quit action."""
@@ -543,9 +585,13 @@ class MeldApp(App[None]):
             panel.set_status(PanelStatus.WAITING)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrchestratorEvent:
-    """Event from orchestrator for TUI updates."""
+    """Event from orchestrator for TUI updates.
+
+    Frozen and slotted: events are created at streaming rates and only
+    ever read, so skipping the per-instance __dict__ is free memory.
+    """
 
     event_type: str
     data: dict[str, Any] = field(default_factory=dict)
@@ -561,76 +607,91 @@ class TUIController:
     def __init__(self, app: MeldApp) -> None:
         """Initialize the controller."""
         self._app = app
+        # Bound-method dispatch table: O(1) lookup per event instead of
+        # walking a match/case chain at stream rates
+        self._handlers: dict[str, Callable[[dict[str, Any]], None]] = {
+            "phase_changed": self._handle_phase_changed,
+            "round_started": self._handle_round_started,
+            "melder_started": self._handle_melder_started,
+            "melder_streaming": self._handle_melder_streaming,
+            "melder_complete": self._handle_melder_complete,
+            "advisor_started": self._handle_advisor_started,
+            "advisor_streaming": self._handle_advisor_streaming,
+            "advisor_complete": self._handle_advisor_complete,
+            "advisor_failed": self._handle_advisor_failed,
+            "advisor_retrying": self._handle_advisor_retrying,
+            "synthesis_started": self._handle_synthesis_started,
+            "converged": self._handle_converged,
+        }
 
     def on_event(self, event: OrchestratorEvent) -> None:
         """Handle an orchestrator event."""
-        match event.event_type:
-            case "phase_changed":
-                phase_name = event.data.get("phase", "Planning")
-                round_num = event.data.get("round", 0)
-                phase = Phase[phase_name.upper()]
-                self._app.set_phase(phase, round_num)
-
-            case "round_started":
-                round_num = event.data.get("round", 1)
-                self._app.set_round(round_num)
-                self._app.set_phase(Phase.FEEDBACK, round_num)
-                self._app.clear_advisors()
-
-            case "melder_started":
-                self._app.set_melder_status(PanelStatus.RUNNING)
-
-            case "melder_streaming":
-                content = event.data.get("content", "")
-                self._app.append_melder(content)
-                self._app.set_melder_status(PanelStatus.STREAMING)
-
-            case "melder_complete":
-                content = event.data.get("content", "")
-                self._app.update_melder(content)
-                self._app.set_melder_status(PanelStatus.COMPLETE)
-
-            case "advisor_started":
-                provider = event.data.get("provider", "")
-                command_parts = event.data.get("command", [])
-                if command_parts:
-                    # Format command with truncated prompt
-                    formatted_cmd = truncate_command_prompt(command_parts)
-                    self._app.set_advisor_command(provider, formatted_cmd)
-                self._app.set_advisor_status(provider, PanelStatus.RUNNING)
-
-            case "advisor_streaming":
-                provider = event.data.get("provider", "")
-                content = event.data.get("content", "")
-                self._app.append_advisor(provider, content)
-                self._app.set_advisor_status(provider, PanelStatus.STREAMING)
-
-            case "advisor_complete":
-                provider = event.data.get("provider", "")
-                content = event.data.get("content", "")
-                self._app.update_advisor(provider, content)
-                self._app.set_advisor_status(provider, PanelStatus.COMPLETE)
-
-            case "advisor_failed":
-                provider = event.data.get("provider", "")
-                error = event.data.get("error", "Unknown error")
-                self._app.update_advisor(provider, f"Error: {error}")
-                self._app.set_advisor_status(provider, PanelStatus.FAILED)
-
-            case "advisor_retrying":
-                provider = event.data.get("provider", "")
-                retry_count = event.data.get("retry", 1)
-                self._app.set_advisor_status(
-                    provider, PanelStatus.RETRYING, retry_count
-                )
-
-            case "synthesis_started":
-                self._app.set_phase(Phase.SYNTHESIZING)
-                self._app.set_melder_status(PanelStatus.RUNNING)
-
-            case "converged":
-                self._app.set_phase(Phase.CONVERGED)
-                self._app.set_melder_status(PanelStatus.COMPLETE)
+        handler = self._handlers.get(event.event_type)
+        if handler is not None:
+            handler(event.data)
+
+    # Per-event handlers; each takes the event's data dict directly
+
+    def _handle_phase_changed(self, data: dict[str, Any]) -> None:
+        phase_name = data.get("phase", "Planning")
+        round_num = data.get("round", 0)
+        phase = Phase[phase_name.upper()]
+        self._app.set_phase(phase, round_num)
+
+    def _handle_round_started(self, data: dict[str, Any]) -> None:
+        round_num = data.get("round", 1)
+        self._app.set_round(round_num)
+        self._app.set_phase(Phase.FEEDBACK, round_num)
+        self._app.clear_advisors()
+
+    def _handle_melder_started(self, data: dict[str, Any]) -> None:
+        self._app.set_melder_status(PanelStatus.RUNNING)
+
+    def _handle_melder_streaming(self, data: dict[str, Any]) -> None:
+        self._app.append_melder(data.get("content", ""))
+        self._app.set_melder_status(PanelStatus.STREAMING)
+
+    def _handle_melder_complete(self, data: dict[str, Any]) -> None:
+        self._app.update_melder(data.get("content", ""))
+        self._app.set_melder_status(PanelStatus.COMPLETE)
+
+    def _handle_advisor_started(self, data: dict[str, Any]) -> None:
+        provider = data.get("provider", "")
+        command_parts = data.get("command", [])
+        if command_parts:
+            # Format command with truncated prompt
+            formatted_cmd = truncate_command_prompt(command_parts)
+            self._app.set_advisor_command(provider, formatted_cmd)
+        self._app.set_advisor_status(provider, PanelStatus.RUNNING)
+
+    def _handle_advisor_streaming(self, data: dict[str, Any]) -> None:
+        provider = data.get("provider", "")
+        self._app.append_advisor(provider, data.get("content", ""))
+        self._app.set_advisor_status(provider, PanelStatus.STREAMING)
+
+    def _handle_advisor_complete(self, data: dict[str, Any]) -> None:
+        provider = data.get("provider", "")
+        self._app.update_advisor(provider, data.get("content", ""))
+        self._app.set_advisor_status(provider, PanelStatus.COMPLETE)
+
+    def _handle_advisor_failed(self, data: dict[str, Any]) -> None:
+        provider = data.get("provider", "")
+        error = data.get("error", "Unknown error")
+        self._app.update_advisor(provider, f"Error: {error}")
+        self._app.set_advisor_status(provider, PanelStatus.FAILED)
+
+    def _handle_advisor_retrying(self, data: dict[str, Any]) -> None:
+        provider = data.get("provider", "")
+        retry_count = data.get("retry", 1)
+        self._app.set_advisor_status(provider, PanelStatus.RETRYING, retry_count)
+
+    def _handle_synthesis_started(self, data: dict[str, Any]) -> None:
+        self._app.set_phase(Phase.SYNTHESIZING)
+        self._app.set_melder_status(PanelStatus.RUNNING)
+
+    def _handle_converged(self, data: dict[str, Any]) -> None:
+        self._app.set_phase(Phase.CONVERGED)
+        self._app.set_melder_status(PanelStatus.COMPLETE)
 
     # Convenience methods for direct orchestrator callbacks
 
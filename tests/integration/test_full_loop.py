@@ -1,15 +1,16 @@
 """Integration tests for full meld loop with mock components."""
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from meld.advisors import AdvisorPool
 from meld.convergence import ConvergenceDetector
 from meld.data_models import AdvisorResult, ConvergenceAssessment, ConvergenceStatus
 from meld.melder import Melder, MelderResult
 from meld.session import SessionManager
+from tests.conftest import existing_artifacts, gather_results
+from tests.mocks.fake_pool import FakeAdvisorPool
 from tests.mocks.mock_adapter import MockAdapter
 
 
@@ -23,11 +24,14 @@ class TestFullLoopIntegration:
             melder = Melder.__new__(Melder)
 
             call_count = [0]
-            last_plan = [None]  # Track last plan for identical return on convergence
+            # Accumulate plan chunks and join on demand so growing the plan
+            # each round copies O(delta) rather than O(full plan) bytes
+            plan_chunks: list[str] = []
 
             async def generate_plan(task, prd_context=None):
+                plan_chunks[:] = ["## Overview\nInitial plan for: " + task]
                 return MelderResult(
-                    plan="## Overview\nInitial plan for: " + task,
+                    plan="".join(plan_chunks),
                     raw_output="Raw initial plan",
                 )
 
@@ -45,10 +49,9 @@ class TestFullLoopIntegration:
                         decision_log="All feedback incorporated",
                         raw_output="Raw synthesis",
                     )
-                new_plan = current_plan + f"\n## Round {round_number} updates"
-                last_plan[0] = new_plan
+                plan_chunks.append(f"\n## Round {round_number} updates")
                 return MelderResult(
-                    plan=new_plan,
+                    plan="".join(plan_chunks),
                     convergence=ConvergenceAssessment(
                         status=ConvergenceStatus.CONTINUING,
                         changes_made=2,
@@ -65,31 +68,12 @@ class TestFullLoopIntegration:
 
     @pytest.fixture
     def mock_advisor_pool(self):
-        """Create a mock advisor pool with mock adapters."""
-        adapters = [
+        """Create a fake advisor pool with mock adapters."""
+        return FakeAdvisorPool([
             MockAdapter(name="claude", delay=0.01),
             MockAdapter(name="gemini", delay=0.01),
             MockAdapter(name="openai", delay=0.01),
-        ]
-
-        async def collect_feedback(plan, task, prd_context=None, round_number=1):
-            import asyncio
-            results = await asyncio.gather(*[
-                adapter.invoke(f"Review plan for round {round_number}")
-                for adapter in adapters
-            ])
-            for r in results:
-                r.round_number = round_number
-            return results
-
-        pool = MagicMock(spec=AdvisorPool)
-        pool.collect_feedback = collect_feedback
-        pool.advisor_names = ["claude", "gemini", "openai"]
-        pool.get_participating_advisors = lambda results: [
-            r.provider for r in results if r.success
-        ]
-
-        return pool
+        ])
 
     @pytest.mark.asyncio
     async def test_full_loop_converges(
@@ -121,15 +105,6 @@ class TestFullLoopIntegration:
                 round_number=round_num,
             )
 
-            # Save feedback
-            for result in results:
-                if result.success:
-                    session.write_advisor_feedback(
-                        result.provider,
-                        result.feedback,
-                        round_num,
-                    )
-
             # Synthesize
             synthesis = await mock_melder.synthesize_feedback(
                 current_plan,
@@ -146,7 +121,12 @@ class TestFullLoopIntegration:
             )
 
             current_plan = synthesis.plan
-            session.write_plan(current_plan, round_num)
+            # Persist plan + feedback with a single metadata update
+            session.commit_round(
+                round_num,
+                current_plan,
+                {r.provider: r.feedback for r in results if r.success},
+            )
             rounds_completed = round_num
 
             if assessment.status == ConvergenceStatus.CONVERGED:
@@ -157,10 +137,11 @@ class TestFullLoopIntegration:
         assert converged
         assert rounds_completed == 3
 
-        # Verify artifacts
+        # Verify artifacts (single directory scan)
         session.mark_complete(converged=True, advisors=["claude", "gemini", "openai"])
-        assert (session.session_path / "plan.round0.md").exists()
-        assert (session.session_path / "plan.round3.md").exists()
+        present = existing_artifacts(session.session_path)
+        assert "plan.round0.md" in present
+        assert "plan.round3.md" in present
 
     @pytest.mark.asyncio
     async def test_loop_handles_advisor_failures(
@@ -185,8 +166,7 @@ class TestFullLoopIntegration:
         adapters[1].set_error(ProviderErrorType.AUTH_FAILED)
 
         async def collect_feedback_with_failure(**kwargs):
-            import asyncio
-            results = await asyncio.gather(*[
+            results = await gather_results([
                 adapter.invoke("Test") for adapter in adapters
             ])
             return results
@@ -220,9 +200,14 @@ class TestFullLoopIntegration:
         with patch.object(Melder, "__init__", lambda self, **kwargs: None):
             melder = Melder.__new__(Melder)
 
+            plan_chunks: list[str] = []
+
             async def never_converge(current_plan, advisor_results, round_number):
+                if not plan_chunks:
+                    plan_chunks.append(current_plan)
+                plan_chunks.append(f"\n## Round {round_number}")
                 return MelderResult(
-                    plan=current_plan + f"\n## Round {round_number}",
+                    plan="".join(plan_chunks),
                     convergence=ConvergenceAssessment(
                         status=ConvergenceStatus.CONTINUING,
                         changes_made=1,
@@ -1,5 +1,6 @@
 """Mock implementations for testing."""
 
+from tests.mocks.fake_pool import FakeAdvisorPool
 from tests.mocks.mock_adapter import MockAdapter
 
-__all__ = ["MockAdapter"]
+__all__ = ["FakeAdvisorPool", "MockAdapter"]
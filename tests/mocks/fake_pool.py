@@ -0,0 +1,38 @@
+"""Lightweight hand-rolled advisor pool stub for testing."""
+
+import asyncio
+
+from meld.data_models import AdvisorResult
+from tests.mocks.mock_adapter import MockAdapter
+
+
+class FakeAdvisorPool:
+    """Plain-class stand-in for AdvisorPool.
+
+    Avoids MagicMock's per-attribute-access proxy overhead in hot test
+    loops while exposing the same surface the orchestrator uses.
+    """
+
+    def __init__(self, adapters: list[MockAdapter]) -> None:
+        self._adapters = adapters
+        self.advisor_names = [adapter.name for adapter in adapters]
+
+    async def collect_feedback(
+        self,
+        plan: str,
+        task: str,
+        prd_context: str | None = None,
+        round_number: int = 1,
+    ) -> list[AdvisorResult]:
+        """Collect feedback from all adapters in parallel."""
+        results = await asyncio.gather(*[
+            adapter.invoke(f"Review plan for round {round_number}")
+            for adapter in self._adapters
+        ])
+        for result in results:
+            result.round_number = round_number
+        return list(results)
+
+    def get_participating_advisors(self, results: list[AdvisorResult]) -> list[str]:
+        """Get providers that returned successful feedback."""
+        return [result.provider for result in results if result.success]
@@ -1,6 +1,12 @@
 """Mock provider adapter for CI testing."""
 
 import asyncio
+import re
+import time
+from collections import deque
+from dataclasses import replace
+from enum import IntEnum
+from types import MappingProxyType
 from typing import AsyncIterator
 
 from meld.data_models import (
@@ -11,6 +17,36 @@ from meld.data_models import (
 )
 from meld.providers.base import ProviderAdapter
 
+# Error types a caller may retry, shared by the templates below and any
+# future membership tests in this module
+_RETRYABLE_ERRORS = frozenset({
+    ProviderErrorType.TIMEOUT,
+    ProviderErrorType.RATE_LIMITED,
+    ProviderErrorType.NETWORK_ERROR,
+})
+
+# Immutable simulated-error templates built once per error type; invoke
+# clones one with the right provider instead of assembling a fresh
+# ProviderError (and re-evaluating retryability) on every failing call
+_ERROR_TEMPLATES = {
+    error_type: ProviderError(
+        error_type=error_type,
+        message=f"Simulated {error_type.label} error",
+        provider="",
+        retryable=error_type in _RETRYABLE_ERRORS,
+    )
+    for error_type in ProviderErrorType
+}
+
+
+class ResponseKind(IntEnum):
+    """Index into MockAdapter's ordered default response table."""
+
+    PLAN = 0
+    FEEDBACK = 1
+    SYNTHESIS = 2
+    CONVERGED = 3
+
 
 class MockAdapter(ProviderAdapter):
     """Mock provider adapter for testing without real CLIs.
@@ -88,11 +124,26 @@ These improvements will enhance reliability and maintainability.
 """,
     }
 
+    # Read-only view shared by all instances (see __init__)
+    _DEFAULTS_RO = MappingProxyType(DEFAULT_RESPONSES)
+
+    # String keys ordered by ResponseKind, and the default bodies as a
+    # tuple so uncustomized lookups are a single array index (spelled
+    # out because class-scope names aren't visible inside comprehensions)
+    _KIND_KEYS = ("plan", "feedback", "synthesis", "converged")
+    _DEFAULTS_SEQ = (
+        DEFAULT_RESPONSES["plan"],
+        DEFAULT_RESPONSES["feedback"],
+        DEFAULT_RESPONSES["synthesis"],
+        DEFAULT_RESPONSES["converged"],
+    )
+
     def __init__(
         self,
         name: str = "mock",
         timeout: int = 600,
         delay: float = 0.1,
+        use_virtual_clock: bool = False,
     ) -> None:
         """Initialize mock adapter.
 
@@ -100,17 +151,30 @@ These improvements will enhance reliability and maintainability.
             name: Name for this mock adapter
             timeout: Timeout (not used but kept for interface compatibility)
             delay: Simulated processing delay in seconds
+            use_virtual_clock: Account for delay without sleeping; invoke()
+                yields once and records the budget in last_invocation_took
         """
         super().__init__(timeout=timeout)
         self._name = name
         self._delay = delay
-        self._responses: dict[str, str] = self.DEFAULT_RESPONSES.copy()
-        self._invocations: list[str] = []
+        self._use_virtual_clock = use_virtual_clock
+        self._chunk_size = 8
+        self.last_invocation_took = 0.0
+        # Copy-on-write: every instance shares the read-only default
+        # table; a private dict is materialized only by set_responses
+        self._responses: MappingProxyType[str, str] | dict[str, str] = self._DEFAULTS_RO
+        self._invocations: deque[str] = deque()
+        self._invocation_trigrams: set[str] = set()
         self._fail_after: int | None = None
         self._invocation_count = 0
         self._should_timeout = False
         self._error_type: ProviderErrorType | None = None
 
+    @classmethod
+    def zero_delay(cls, name: str = "mock") -> "MockAdapter":
+        """Create an adapter with simulated delay disabled entirely."""
+        return cls(name=name, delay=0)
+
     @property
     def name(self) -> str:
         return self._name
@@ -141,12 +205,18 @@ These improvements will enhance reliability and maintainability.
         Args:
             responses: Dict mapping prompt substrings or types to responses
         """
+        if self._responses is self._DEFAULTS_RO:
+            self._responses = dict(self._DEFAULTS_RO)
         self._responses.update(responses)
 
     def set_delay(self, delay: float) -> None:
         """Set the simulated processing delay."""
         self._delay = delay
 
+    def set_chunk_size(self, chunk_size: int) -> None:
+        """Set how many lines each streamed event carries."""
+        self._chunk_size = chunk_size
+
     def set_fail_after(self, count: int) -> None:
         """Configure the adapter to fail after N invocations."""
         self._fail_after = count
@@ -161,7 +231,8 @@ These improvements will enhance reliability and maintainability.
 
     def reset(self) -> None:
         """Reset the adapter state."""
-        self._invocations = []
+        self._invocations.clear()
+        self._invocation_trigrams.clear()
         self._invocation_count = 0
         self._should_timeout = False
         self._error_type = None
@@ -174,15 +245,33 @@ These improvements will enhance reliability and maintainability.
     @property
     def invocations(self) -> list[str]:
         """Get list of all prompts received."""
-        return self._invocations.copy()
+        return list(self._invocations)
 
     @property
     def invocation_count(self) -> int:
         """Get total number of invocations."""
         return self._invocation_count
 
+    def _record_invocation(self, prompt: str) -> None:
+        """Record a prompt and index its trigrams for was_called_with."""
+        self._invocations.append(prompt)
+        self._invocation_count += 1
+        self._invocation_trigrams.update(
+            prompt[i:i + 3] for i in range(len(prompt) - 2)
+        )
+
     def was_called_with(self, substring: str) -> bool:
-        """Check if any invocation contained the given substring."""
+        """Check if any invocation contained the given substring.
+
+        A trigram index over recorded prompts rejects most misses in
+        O(len(substring)); the full history scan only runs when every
+        trigram of the needle has been seen.
+        """
+        if len(substring) >= 3 and any(
+            substring[i:i + 3] not in self._invocation_trigrams
+            for i in range(len(substring) - 2)
+        ):
+            return False
         return any(substring in inv for inv in self._invocations)
 
     # ========================================================================
@@ -190,100 +279,106 @@ These improvements will enhance reliability and maintainability.
     # ========================================================================
 
     async def invoke(self, prompt: str) -> AdvisorResult:
-        """Invoke the mock adapter."""
-        import time
+        """Invoke the mock adapter.
 
-        start = time.monotonic()
-        self._invocations.append(prompt)
-        self._invocation_count += 1
+        Single-return structure: branches only decide error vs feedback,
+        and the duration is computed once (monotonic_ns, integer math)
+        at the exit point.
+        """
+        start_ns = time.monotonic_ns()
+        self._record_invocation(prompt)
 
         # Simulate processing delay
-        await asyncio.sleep(self._delay)
+        if self._use_virtual_clock:
+            # Yield once so concurrency is still exercised, but don't burn
+            # wall-clock time; record the budget for assertions instead
+            await asyncio.sleep(0)
+            self.last_invocation_took = self._delay
+        elif self._delay > 0:
+            await asyncio.sleep(self._delay)
+            self.last_invocation_took = (time.monotonic_ns() - start_ns) / 1e9
+        else:
+            # delay disabled: return without even a scheduler tick
+            self.last_invocation_took = 0.0
+
+        error: ProviderError | None = None
+        feedback = ""
 
         # Check for configured failures
         if self._fail_after is not None and self._invocation_count > self._fail_after:
-            return AdvisorResult(
+            error = ProviderError(
+                error_type=ProviderErrorType.UNKNOWN,
+                message="Configured to fail after N invocations",
                 provider=self._name,
-                success=False,
-                error=ProviderError(
-                    error_type=ProviderErrorType.UNKNOWN,
-                    message="Configured to fail after N invocations",
-                    provider=self._name,
-                ),
-                duration_seconds=time.monotonic() - start,
             )
-
-        if self._should_timeout:
-            return AdvisorResult(
+        elif self._should_timeout:
+            error = ProviderError(
+                error_type=ProviderErrorType.TIMEOUT,
+                message="Simulated timeout",
                 provider=self._name,
-                success=False,
-                error=ProviderError(
-                    error_type=ProviderErrorType.TIMEOUT,
-                    message="Simulated timeout",
-                    provider=self._name,
-                    retryable=True,
-                ),
-                duration_seconds=time.monotonic() - start,
+                retryable=True,
             )
-
-        if self._error_type:
-            return AdvisorResult(
-                provider=self._name,
-                success=False,
-                error=ProviderError(
-                    error_type=self._error_type,
-                    message=f"Simulated {self._error_type.value} error",
-                    provider=self._name,
-                    retryable=self._error_type
-                    in [
-                        ProviderErrorType.TIMEOUT,
-                        ProviderErrorType.RATE_LIMITED,
-                        ProviderErrorType.NETWORK_ERROR,
-                    ],
-                ),
-                duration_seconds=time.monotonic() - start,
-            )
-
-        # Determine response based on prompt content
-        response = self._get_response_for_prompt(prompt)
+        elif self._error_type:
+            error = replace(_ERROR_TEMPLATES[self._error_type], provider=self._name)
+        else:
+            # Determine response based on prompt content
+            feedback = self._get_response_for_prompt(prompt)
 
         return AdvisorResult(
             provider=self._name,
-            success=True,
-            feedback=response,
-            duration_seconds=time.monotonic() - start,
+            success=error is None,
+            feedback=feedback,
+            error=error,
+            duration_seconds=(time.monotonic_ns() - start_ns) / 1e9,
         )
 
     async def invoke_streaming(self, prompt: str) -> AsyncIterator[StreamEvent]:
-        """Invoke with streaming output."""
-        self._invocations.append(prompt)
-        self._invocation_count += 1
+        """Invoke with streaming output.
+
+        Lines are coalesced into chunks of _chunk_size per StreamEvent
+        with one sleep per chunk, rather than one event and one sleep
+        per line. A delay of 0 skips sleeping entirely.
+        """
+        self._record_invocation(prompt)
 
         response = self._get_response_for_prompt(prompt)
 
-        # Stream response line by line
-        for line in response.split("\n"):
-            await asyncio.sleep(self._delay / 10)
-            yield StreamEvent(provider=self._name, content=line + "\n")
+        lines = response.splitlines(keepends=True)
+        for i in range(0, len(lines), self._chunk_size):
+            if self._delay > 0:
+                await asyncio.sleep(self._delay / 10)
+            yield StreamEvent(
+                provider=self._name,
+                content="".join(lines[i:i + self._chunk_size]),
+            )
 
         yield StreamEvent(provider=self._name, content="", is_complete=True)
 
+    # All trigger keywords compiled into one alternation so routing does a
+    # single pass over the prompt instead of one substring scan per trigger
+    _TRIGGER_RE = re.compile(
+        r"initial plan|create a|synthesize|feedback|round 5|final|review|advisor"
+    )
+
     def _get_response_for_prompt(self, prompt: str) -> str:
         """Get the appropriate response for a prompt."""
         prompt_lower = prompt.lower()
 
-        # Check for specific response patterns
-        if "initial plan" in prompt_lower or "create a" in prompt_lower:
-            return self._responses.get("plan", self.DEFAULT_RESPONSES["plan"])
+        # Collect every trigger hit in one scan, then apply the priority
+        # order against the hit set
+        hits = set(self._TRIGGER_RE.findall(prompt_lower))
+
+        if "initial plan" in hits or "create a" in hits:
+            return self._lookup(ResponseKind.PLAN)
 
-        if "synthesize" in prompt_lower or "feedback" in prompt_lower:
+        if "synthesize" in hits or "feedback" in hits:
             # Check if we should return converged response
-            if "round 5" in prompt_lower or "final" in prompt_lower:
-                return self._responses.get("converged", self.DEFAULT_RESPONSES["converged"])
-            return self._responses.get("synthesis", self.DEFAULT_RESPONSES["synthesis"])
+            if "round 5" in hits or "final" in hits:
+                return self._lookup(ResponseKind.CONVERGED)
+            return self._lookup(ResponseKind.SYNTHESIS)
 
-        if "review" in prompt_lower or "advisor" in prompt_lower:
-            return self._responses.get("feedback", self.DEFAULT_RESPONSES["feedback"])
+        if "review" in hits or "advisor" in hits:
+            return self._lookup(ResponseKind.FEEDBACK)
 
         # Check for custom responses by substring
         for key, value in self._responses.items():
@@ -291,7 +386,17 @@ These improvements will enhance reliability and maintainability.
                 return value
 
         # Default to feedback response
-        return self._responses.get("feedback", self.DEFAULT_RESPONSES["feedback"])
+        return self._lookup(ResponseKind.FEEDBACK)
+
+    def _lookup(self, kind: ResponseKind) -> str:
+        """Resolve a response body for a routed kind.
+
+        Uncustomized adapters index straight into the default tuple;
+        only instances with set_responses overrides pay the dict lookup.
+        """
+        if self._responses is self._DEFAULTS_RO:
+            return self._DEFAULTS_SEQ[kind]
+        return self._responses.get(self._KIND_KEYS[kind], self._DEFAULTS_SEQ[kind])
 
 
 class MockAdapterFactory:
@@ -328,9 +433,15 @@ class MockAdapterFactory:
         """Create a mock adapter that converges at a specific round."""
         adapter = MockAdapter(name=name)
 
+        # Compile the round needle once at factory time; IGNORECASE
+        # avoids a per-invocation lowercase copy of the prompt. The
+        # responder was previously defined but never installed.
+        needle = re.compile(rf"round {converge_at_round}\b", re.IGNORECASE)
+
         def custom_response(prompt: str) -> str:
-            if f"round {converge_at_round}" in prompt.lower():
+            if needle.search(prompt):
                 return MockAdapter.DEFAULT_RESPONSES["converged"]
             return MockAdapter.DEFAULT_RESPONSES["synthesis"]
 
+        adapter._get_response_for_prompt = custom_response  # type: ignore[method-assign]
         return adapter
@@ -0,0 +1,16 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from meld.session import SessionManager
+
+
+@pytest.fixture
+def session_mgr(temp_run_dir) -> SessionManager:
+    """A freshly constructed default session manager.
+
+    Replaces the SessionManager(task="Test task", ...) boilerplate
+    repeated across test_session.py; tests that need non-default
+    construction (no_save, resume_id, buffered) build their own.
+    """
+    return SessionManager(task="Test task", run_dir=str(temp_run_dir))
@@ -6,37 +6,121 @@ import pytest
 
 from meld.advisors import AdvisorPool
 from meld.data_models import AdvisorResult, ProviderError, ProviderErrorType
+from meld.providers import ClaudeAdapter, GeminiAdapter, OpenAIAdapter
+
+# Reusable adapter stubs: built once at import, reset per test. Entering
+# one patch.multiple is cheaper than three nested patch() managers plus
+# three MagicMock constructions per test. spec_set keeps attribute
+# lookups O(1) and stops MagicMock from materializing lazy child mocks
+# (and catches typos against the real adapter API).
+_STUB_NAMES = {"claude": "Claude", "gemini": "Gemini", "openai": "OpenAI"}
+_STUB_SPECS = {"claude": ClaudeAdapter, "gemini": GeminiAdapter, "openai": OpenAIAdapter}
+_ADAPTER_STUBS = {name: MagicMock(spec_set=spec) for name, spec in _STUB_SPECS.items()}
+_ADAPTER_PATCHES = {
+    "ClaudeAdapter": MagicMock(return_value=_ADAPTER_STUBS["claude"]),
+    "GeminiAdapter": MagicMock(return_value=_ADAPTER_STUBS["gemini"]),
+    "OpenAIAdapter": MagicMock(return_value=_ADAPTER_STUBS["openai"]),
+}
+
+# Shared result templates, built once at import. The pool stamps
+# round_number onto results, which is safe to share here because every
+# test stamps its own round before asserting on it.
+_OK_RESULTS = {
+    name: AdvisorResult(provider=name, success=True, feedback=f"{display} feedback")
+    for name, display in _STUB_NAMES.items()
+}
+_GEMINI_TIMEOUT = AdvisorResult(
+    provider="gemini",
+    success=False,
+    error=ProviderError(
+        error_type=ProviderErrorType.TIMEOUT,
+        message="Timeout",
+        provider="gemini",
+    ),
+)
+_GEMINI_TIMEOUT_RETRYABLE = AdvisorResult(
+    provider="gemini",
+    success=False,
+    error=ProviderError(
+        error_type=ProviderErrorType.TIMEOUT,
+        message="Timeout",
+        provider="gemini",
+        retryable=True,
+    ),
+)
+_GEMINI_RETRY_OK = AdvisorResult(
+    provider="gemini", success=True, feedback="Retry succeeded"
+)
+_CLAUDE_RATE_LIMITED = AdvisorResult(
+    provider="claude",
+    success=False,
+    error=ProviderError(
+        error_type=ProviderErrorType.RATE_LIMITED,
+        message="Rate limited",
+        provider="claude",
+        retryable=True,
+    ),
+)
+_CLAUDE_RETRY_OK = AdvisorResult(
+    provider="claude", success=True, feedback="Eventually succeeded"
+)
+def _const_async(result: AdvisorResult):
+    """Return an async callable that always returns *result*.
+
+    Cheaper than AsyncMock when call counts are never asserted: no
+    call recording or child-mock bookkeeping per invocation. Tests
+    that assert call_count still install an AsyncMock themselves.
+    """
+
+    async def _invoke(*args: object, **kwargs: object) -> AdvisorResult:
+        return result
+
+    return _invoke
+
+
+_OPENAI_AUTH_FAILED = AdvisorResult(
+    provider="openai",
+    success=False,
+    error=ProviderError(
+        error_type=ProviderErrorType.AUTH_FAILED,
+        message="Auth failed",
+        provider="openai",
+        retryable=False,
+    ),
+)
 
 
 class TestAdvisorPool:
     """Tests for AdvisorPool."""
 
-    @pytest.fixture
-    def mock_adapters(self):
-        """Create mock adapters for all providers."""
-        with patch("meld.advisors.ClaudeAdapter") as MockClaude, \
-             patch("meld.advisors.GeminiAdapter") as MockGemini, \
-             patch("meld.advisors.OpenAIAdapter") as MockOpenAI:
+    @pytest.fixture(autouse=True)
+    def _fast_sleep(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Make retry backoff instantaneous.
 
-            claude = MockClaude.return_value
-            claude.name = "claude"
-            claude.invoke = AsyncMock(return_value=AdvisorResult(
-                provider="claude", success=True, feedback="Claude feedback"
-            ))
+        The rate-limit retry path sleeps for seconds of real time;
+        these tests verify the retry logic, not the delays.
+        """
+        monkeypatch.setattr("meld.advisors.asyncio.sleep", AsyncMock())
 
-            gemini = MockGemini.return_value
-            gemini.name = "gemini"
-            gemini.invoke = AsyncMock(return_value=AdvisorResult(
-                provider="gemini", success=True, feedback="Gemini feedback"
-            ))
+    @pytest.fixture(scope="class")
+    def _patched_adapters(self):
+        """Keep the adapter constructor patches active for the whole class.
 
-            openai = MockOpenAI.return_value
-            openai.name = "openai"
-            openai.invoke = AsyncMock(return_value=AdvisorResult(
-                provider="openai", success=True, feedback="OpenAI feedback"
-            ))
+        Safe because tests only reconfigure the returned stubs (via
+        mock_adapters below), never the patched classes themselves.
+        """
+        with patch.multiple("meld.advisors", **_ADAPTER_PATCHES):
+            yield _ADAPTER_STUBS
 
-            yield {"claude": claude, "gemini": gemini, "openai": openai}
+    @pytest.fixture
+    def mock_adapters(self, _patched_adapters):
+        """Hand each test the shared stubs, freshly configured."""
+        for name, stub in _patched_adapters.items():
+            stub.reset_mock(return_value=True, side_effect=True)
+            stub.name = name
+            stub.invoke = _const_async(_OK_RESULTS[name])
+
+        return dict(_patched_adapters)
 
     @pytest.mark.asyncio
     async def test_collects_feedback_from_all_advisors(self, mock_adapters) -> None:
@@ -72,17 +156,7 @@ class TestAdvisorPool:
     @pytest.mark.asyncio
     async def test_handles_advisor_failure(self, mock_adapters) -> None:
         """Handles failed advisor gracefully."""
-        mock_adapters["gemini"].invoke = AsyncMock(
-            return_value=AdvisorResult(
-                provider="gemini",
-                success=False,
-                error=ProviderError(
-                    error_type=ProviderErrorType.TIMEOUT,
-                    message="Timeout",
-                    provider="gemini",
-                ),
-            )
-        )
+        mock_adapters["gemini"].invoke = _const_async(_GEMINI_TIMEOUT)
 
         pool = AdvisorPool()
         results = await pool.collect_feedback(
@@ -104,21 +178,8 @@ class TestAdvisorPool:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return AdvisorResult(
-                    provider="gemini",
-                    success=False,
-                    error=ProviderError(
-                        error_type=ProviderErrorType.TIMEOUT,
-                        message="Timeout",
-                        provider="gemini",
-                        retryable=True,
-                    ),
-                )
-            return AdvisorResult(
-                provider="gemini",
-                success=True,
-                feedback="Retry succeeded",
-            )
+                return _GEMINI_TIMEOUT_RETRYABLE
+            return _GEMINI_RETRY_OK
 
         mock_adapters["gemini"].invoke = flaky_invoke
 
@@ -142,21 +203,8 @@ class TestAdvisorPool:
             nonlocal call_count
             call_count += 1
             if call_count <= 2:
-                return AdvisorResult(
-                    provider="claude",
-                    success=False,
-                    error=ProviderError(
-                        error_type=ProviderErrorType.RATE_LIMITED,
-                        message="Rate limited",
-                        provider="claude",
-                        retryable=True,
-                    ),
-                )
-            return AdvisorResult(
-                provider="claude",
-                success=True,
-                feedback="Eventually succeeded",
-            )
+                return _CLAUDE_RATE_LIMITED
+            return _CLAUDE_RETRY_OK
 
         mock_adapters["claude"].invoke = rate_limited_invoke
 
@@ -174,18 +222,7 @@ class TestAdvisorPool:
     @pytest.mark.asyncio
     async def test_no_retry_for_auth_failure(self, mock_adapters) -> None:
         """Does not retry auth failures."""
-        mock_adapters["openai"].invoke = AsyncMock(
-            return_value=AdvisorResult(
-                provider="openai",
-                success=False,
-                error=ProviderError(
-                    error_type=ProviderErrorType.AUTH_FAILED,
-                    message="Auth failed",
-                    provider="openai",
-                    retryable=False,
-                ),
-            )
-        )
+        mock_adapters["openai"].invoke = AsyncMock(return_value=_OPENAI_AUTH_FAILED)
 
         pool = AdvisorPool()
         results = await pool.collect_feedback(
@@ -1,25 +1,79 @@
 """Unit tests for Melder component."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+import meld.melder
 from meld.data_models import AdvisorResult, ConvergenceStatus
 from meld.melder import Melder
 
+# Shared synthesis-output shape: one template instead of a ~15-line
+# triple-quoted blob per test
+FEEDBACK_TEMPLATE = """## Updated Plan
+{plan}
+
+## Convergence Assessment
+```json
+{{
+    "STATUS": "{status}",
+    "CHANGES_MADE": {changes_made},
+    "OPEN_ITEMS": {open_items},
+    "RATIONALE": "{rationale}"
+}}
+```
+"""
+
+# Advisor result sets shared across synthesis tests; synthesize_feedback
+# only reads them, so module-level instances are safe to reuse
+_ADVISORS_OK = (
+    AdvisorResult(provider="claude", success=True, feedback="Add error handling"),
+    AdvisorResult(provider="gemini", success=True, feedback="Consider performance"),
+)
+_ADVISORS_MIXED = (
+    AdvisorResult(provider="claude", success=True, feedback="Good feedback"),
+    AdvisorResult(provider="gemini", success=False, feedback=""),
+    AdvisorResult(provider="openai", success=True, feedback="More feedback"),
+)
+
+
+class _StubInvoke:
+    """Minimal async stand-in for AsyncMock.
+
+    The Melder tests only set return_value and read call_args[0][0];
+    a plain recording coroutine avoids AsyncMock's per-call mock
+    machinery.
+    """
+
+    def __init__(self) -> None:
+        self.return_value: AdvisorResult | None = None
+        self.call_args: tuple | None = None
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args = (args, kwargs)
+        return self.return_value
+
 
 class TestMelder:
     """Tests for Melder component."""
 
     @pytest.fixture
     def mock_claude_invoke(self):
-        """Mock Claude adapter invoke method."""
-        with patch("meld.melder.ClaudeAdapter") as MockClaude:
-            instance = MockClaude.return_value
-            instance.invoke = AsyncMock()
-            yield instance.invoke
+        """Mock Claude adapter invoke method.
+
+        Swaps the module attribute directly instead of going through
+        unittest.mock.patch — same semantics without the patcher's
+        import-system walk on every test.
+        """
+        original = meld.melder.ClaudeAdapter
+        fake = MagicMock()
+        fake.return_value.invoke = _StubInvoke()
+        meld.melder.ClaudeAdapter = fake
+        try:
+            yield fake.return_value.invoke
+        finally:
+            meld.melder.ClaudeAdapter = original
 
-    @pytest.mark.asyncio
     async def test_generate_initial_plan(self, mock_claude_invoke) -> None:
         """Generates initial plan from task."""
         mock_claude_invoke.return_value = AdvisorResult(
@@ -40,7 +94,6 @@ This is the generated plan content.
         assert result.plan is not None
         assert "generated plan" in result.plan.lower() or "step" in result.plan.lower()
 
-    @pytest.mark.asyncio
     async def test_generate_initial_plan_with_prd(self, mock_claude_invoke) -> None:
         """Includes PRD context in plan generation."""
         mock_claude_invoke.return_value = AdvisorResult(
@@ -59,7 +112,6 @@ This is the generated plan content.
         call_args = mock_claude_invoke.call_args[0][0]
         assert "OAuth2" in call_args
 
-    @pytest.mark.asyncio
     async def test_generate_plan_failure(self, mock_claude_invoke) -> None:
         """Raises error when plan generation fails."""
         mock_claude_invoke.return_value = AdvisorResult(
@@ -72,47 +124,25 @@ This is the generated plan content.
         with pytest.raises(RuntimeError, match="Melder failed"):
             await melder.generate_initial_plan("Add authentication")
 
-    @pytest.mark.asyncio
     async def test_synthesize_feedback(self, mock_claude_invoke) -> None:
         """Synthesizes advisor feedback into updated plan."""
         mock_claude_invoke.return_value = AdvisorResult(
             provider="claude",
             success=True,
-            feedback="""## Decision Log
-- ACCEPTED: Add error handling
-
-## Updated Plan
-Updated plan with improvements.
-
-## Convergence Assessment
-```json
-{
-    "STATUS": "CONTINUING",
-    "CHANGES_MADE": 2,
-    "OPEN_ITEMS": 1,
-    "RATIONALE": "Still improving"
-}
-```
-""",
+            feedback="## Decision Log\n- ACCEPTED: Add error handling\n\n"
+            + FEEDBACK_TEMPLATE.format(
+                plan="Updated plan with improvements.",
+                status="CONTINUING",
+                changes_made=2,
+                open_items=1,
+                rationale="Still improving",
+            ),
         )
 
         melder = Melder()
-        advisor_results = [
-            AdvisorResult(
-                provider="claude",
-                success=True,
-                feedback="Add error handling",
-            ),
-            AdvisorResult(
-                provider="gemini",
-                success=True,
-                feedback="Consider performance",
-            ),
-        ]
-
         result = await melder.synthesize_feedback(
             current_plan="Original plan",
-            advisor_results=advisor_results,
+            advisor_results=list(_ADVISORS_OK),
             round_number=1,
         )
 
@@ -121,25 +151,18 @@ Updated plan with improvements.
         assert result.convergence.status == ConvergenceStatus.CONTINUING
         assert result.convergence.changes_made == 2
 
-    @pytest.mark.asyncio
     async def test_synthesize_with_converged_status(self, mock_claude_invoke) -> None:
         """Detects converged status from synthesis."""
         mock_claude_invoke.return_value = AdvisorResult(
             provider="claude",
             success=True,
-            feedback="""## Updated Plan
-Final plan.
-
-## Convergence Assessment
-```json
-{
-    "STATUS": "CONVERGED",
-    "CHANGES_MADE": 0,
-    "OPEN_ITEMS": 0,
-    "RATIONALE": "No more changes needed"
-}
-```
-""",
+            feedback=FEEDBACK_TEMPLATE.format(
+                plan="Final plan.",
+                status="CONVERGED",
+                changes_made=0,
+                open_items=0,
+                rationale="No more changes needed",
+            ),
         )
 
         melder = Melder()
@@ -152,7 +175,6 @@ Final plan.
         assert result.convergence is not None
         assert result.convergence.status == ConvergenceStatus.CONVERGED
 
-    @pytest.mark.asyncio
     async def test_extracts_decision_log(self, mock_claude_invoke) -> None:
         """Extracts decision log from synthesis output."""
         mock_claude_invoke.return_value = AdvisorResult(
@@ -178,7 +200,6 @@ Plan content.
         assert "ACCEPTED" in result.decision_log
         assert "REJECTED" in result.decision_log
 
-    @pytest.mark.asyncio
     async def test_handles_failed_advisors(self, mock_claude_invoke) -> None:
         """Handles mix of successful and failed advisor results."""
         mock_claude_invoke.return_value = AdvisorResult(
@@ -188,15 +209,9 @@ Plan content.
         )
 
         melder = Melder()
-        advisor_results = [
-            AdvisorResult(provider="claude", success=True, feedback="Good feedback"),
-            AdvisorResult(provider="gemini", success=False, feedback=""),
-            AdvisorResult(provider="openai", success=True, feedback="More feedback"),
-        ]
-
         result = await melder.synthesize_feedback(
             current_plan="Plan",
-            advisor_results=advisor_results,
+            advisor_results=list(_ADVISORS_MIXED),
             round_number=1,
         )
 
@@ -205,13 +220,21 @@ Plan content.
         assert "Failed" in call_args or "gemini" in call_args.lower()
 
 
+@pytest.fixture(scope="module")
+def melder() -> Melder:
+    """One Melder shared by the pure extraction tests.
+
+    _extract_plan and _extract_convergence never mutate instance
+    state, so a module-scoped instance is safe.
+    """
+    return Melder()
+
+
 class TestPlanExtraction:
     """Tests for plan content extraction."""
 
-    def test_extracts_plan_section(self) -> None:
+    def test_extracts_plan_section(self, melder: Melder) -> None:
         """Extracts plan from marked section."""
-        melder = Melder()
-
         output = """Some preamble.
 
 ## Plan
@@ -226,10 +249,8 @@ Other content.
         assert "This is the plan content" in plan
         assert "Other content" not in plan
 
-    def test_handles_missing_markers(self) -> None:
+    def test_handles_missing_markers(self, melder: Melder) -> None:
         """Returns full output when no plan markers found."""
-        melder = Melder()
-
         output = "Just some content without markers."
         plan = melder._extract_plan(output)
 
@@ -239,43 +260,30 @@ Other content.
 class TestConvergenceExtraction:
     """Tests for convergence assessment extraction."""
 
-    def test_extracts_json_assessment(self) -> None:
-        """Extracts convergence from JSON block."""
-        melder = Melder()
-
-        output = """
-Some content.
-
-```json
-{
-    "STATUS": "CONVERGED",
-    "CHANGES_MADE": 0,
-    "OPEN_ITEMS": 0,
-    "RATIONALE": "All done"
-}
-```
-"""
-        convergence = melder._extract_convergence(output)
-
-        assert convergence is not None
-        assert convergence.status == ConvergenceStatus.CONVERGED
-        assert convergence.changes_made == 0
-
-    def test_extracts_inline_status(self) -> None:
-        """Extracts convergence from inline markers."""
-        melder = Melder()
-
-        output = "The plan is complete. STATUS: CONVERGED"
-        convergence = melder._extract_convergence(output)
-
-        assert convergence is not None
-        assert convergence.status == ConvergenceStatus.CONVERGED
-
-    def test_returns_none_when_no_assessment(self) -> None:
-        """Returns None when no assessment found."""
-        melder = Melder()
-
-        output = "Just a regular response without convergence info."
+    @pytest.mark.parametrize(
+        "output,expected_status",
+        [
+            # JSON block assessment
+            (
+                FEEDBACK_TEMPLATE.format(
+                    plan="Some content.",
+                    status="CONVERGED",
+                    changes_made=0,
+                    open_items=0,
+                    rationale="All done",
+                ),
+                ConvergenceStatus.CONVERGED,
+            ),
+            # Inline status marker
+            ("The plan is complete. STATUS: CONVERGED", ConvergenceStatus.CONVERGED),
+            # No assessment at all
+            ("Just a regular response without convergence info.", None),
+        ],
+    )
+    def test_extract_convergence(
+        self, melder: Melder, output, expected_status
+    ) -> None:
+        """Extracts the assessment from JSON, inline markers, or returns None."""
         convergence = melder._extract_convergence(output)
 
-        assert convergence is None
+        assert (convergence.status if convergence else None) == expected_status
@@ -1,7 +1,7 @@
 """Unit tests for orchestrator."""
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -10,60 +10,99 @@ from meld.melder import MelderResult
 from meld.orchestrator import MeldResult, Orchestrator, run_meld
 
 
+class _StubAsync:
+    """Recording async stub, a cheap AsyncMock stand-in.
+
+    Tracks .called and .call_args — the only introspection the
+    orchestrator tests perform — without AsyncMock's per-call
+    machinery.
+    """
+
+    def __init__(self, return_value=None) -> None:
+        self.return_value = return_value
+        self.call_args: tuple | None = None
+        self.call_count = 0
+
+    @property
+    def called(self) -> bool:
+        return self.call_count > 0
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        return self.return_value
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_components():
+    """Patch all orchestrator collaborators once for the module.
+
+    One patch.multiple entry/exit instead of four context managers
+    per test; per-test fixtures reset and reconfigure the mocks.
+    """
+    with patch.multiple(
+        "meld.orchestrator",
+        Melder=DEFAULT,
+        AdvisorPool=DEFAULT,
+        ConvergenceDetector=DEFAULT,
+        run_preflight=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
 class TestOrchestrator:
     """Tests for Orchestrator."""
 
     @pytest.fixture
-    def mock_components(self, temp_run_dir: Path):
-        """Mock all orchestrator components."""
-        with patch("meld.orchestrator.Melder") as MockMelder, \
-             patch("meld.orchestrator.AdvisorPool") as MockPool, \
-             patch("meld.orchestrator.ConvergenceDetector") as MockConvergence, \
-             patch("meld.orchestrator.run_preflight") as mock_preflight:
-
-            # Mock preflight
-            mock_preflight.return_value = [
-                MagicMock(cli_found=True, auth_valid=True, provider="claude")
-            ]
-
-            # Mock melder
-            melder = MockMelder.return_value
-            melder.generate_initial_plan = AsyncMock(return_value=MelderResult(
-                plan="Initial plan content",
-                raw_output="Raw output",
-            ))
-            melder.synthesize_feedback = AsyncMock(return_value=MelderResult(
-                plan="Updated plan content",
-                convergence=ConvergenceAssessment(
-                    status=ConvergenceStatus.CONVERGED,
-                    changes_made=0,
-                    open_items=0,
-                ),
-                decision_log="Decision log",
-                raw_output="Raw output",
-            ))
-
-            # Mock advisor pool
-            pool = MockPool.return_value
-            pool.collect_feedback = AsyncMock(return_value=[
-                AdvisorResult(provider="claude", success=True, feedback="Feedback"),
-            ])
-            pool.get_participating_advisors = MagicMock(return_value=["claude"])
-
-            # Mock convergence
-            convergence = MockConvergence.return_value
-            convergence.check_convergence = MagicMock(return_value=ConvergenceAssessment(
+    def mock_components(self, patched_components):
+        """Reset and configure the shared component mocks."""
+        for mock in patched_components.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
+        # Mock preflight
+        mock_preflight = patched_components["run_preflight"]
+        mock_preflight.return_value = [
+            MagicMock(cli_found=True, auth_valid=True, provider="claude")
+        ]
+
+        # Mock melder
+        melder = patched_components["Melder"].return_value
+        melder.generate_initial_plan = _StubAsync(MelderResult(
+            plan="Initial plan content",
+            raw_output="Raw output",
+        ))
+        melder.synthesize_feedback = _StubAsync(MelderResult(
+            plan="Updated plan content",
+            convergence=ConvergenceAssessment(
                 status=ConvergenceStatus.CONVERGED,
                 changes_made=0,
                 open_items=0,
-            ))
+            ),
+            decision_log="Decision log",
+            raw_output="Raw output",
+        ))
+
+        # Mock advisor pool
+        pool = patched_components["AdvisorPool"].return_value
+        pool.collect_feedback = _StubAsync([
+            AdvisorResult(provider="claude", success=True, feedback="Feedback"),
+        ])
+        pool.get_participating_advisors = MagicMock(return_value=["claude"])
+
+        # Mock convergence
+        convergence = patched_components["ConvergenceDetector"].return_value
+        convergence.check_convergence = MagicMock(return_value=ConvergenceAssessment(
+            status=ConvergenceStatus.CONVERGED,
+            changes_made=0,
+            open_items=0,
+        ))
 
-            yield {
-                "melder": melder,
-                "pool": pool,
-                "convergence": convergence,
-                "preflight": mock_preflight,
-            }
+        return {
+            "melder": melder,
+            "pool": pool,
+            "convergence": convergence,
+            "preflight": mock_preflight,
+        }
 
     @pytest.mark.asyncio
     async def test_runs_full_loop(self, mock_components, temp_run_dir: Path) -> None:
@@ -104,6 +143,51 @@ class TestOrchestrator:
         assert result.converged is True
         assert result.rounds_completed == 1  # Stopped after first round
 
+    @pytest.mark.asyncio
+    async def test_stability_window_requires_streak(
+        self, mock_components, temp_run_dir: Path
+    ) -> None:
+        """With stability_window=2, one CONVERGED round is not enough."""
+        orchestrator = Orchestrator(
+            task="Test task",
+            max_rounds=5,
+            run_dir=str(temp_run_dir),
+            quiet=True,
+            skip_preflight=True,
+            stability_window=2,
+        )
+
+        result = await orchestrator.run()
+
+        # Every round reports CONVERGED; the second confirms the first
+        assert result.converged is True
+        assert result.rounds_completed == 2
+
+    @pytest.mark.asyncio
+    async def test_epsilon_early_stop(self, mock_components, temp_run_dir: Path) -> None:
+        """Stops early when plan change falls below convergence_epsilon."""
+        # Melder keeps claiming CONTINUING, but the synthesized plan
+        # stops changing after round 1
+        mock_components["convergence"].check_convergence.return_value = ConvergenceAssessment(
+            status=ConvergenceStatus.CONTINUING,
+            changes_made=1,
+            open_items=0,
+        )
+
+        orchestrator = Orchestrator(
+            task="Test task",
+            max_rounds=5,
+            run_dir=str(temp_run_dir),
+            quiet=True,
+            skip_preflight=True,
+            convergence_epsilon=0.05,
+        )
+
+        result = await orchestrator.run()
+
+        assert result.converged is True
+        assert result.rounds_completed < 5
+
     @pytest.mark.asyncio
     async def test_respects_max_rounds(self, mock_components, temp_run_dir: Path) -> None:
         """Stops at max rounds even if not converged."""
@@ -251,39 +335,44 @@ class TestSignalHandling:
     """Tests for signal handling."""
 
     @pytest.mark.asyncio
-    async def test_handles_interrupt(self, temp_run_dir: Path) -> None:
-        """Handles interrupt signal gracefully."""
-        with patch("meld.orchestrator.Melder") as MockMelder, \
-             patch("meld.orchestrator.AdvisorPool") as MockPool, \
-             patch("meld.orchestrator.ConvergenceDetector"), \
-             patch("meld.orchestrator.run_preflight") as mock_preflight:
+    async def test_handles_interrupt(self, patched_components, temp_run_dir: Path) -> None:
+        """Stops the loop when the interrupt flag is set mid-round."""
+        for mock in patched_components.values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
+        patched_components["run_preflight"].return_value = [MagicMock(cli_found=True)]
+
+        melder = patched_components["Melder"].return_value
+        melder.generate_initial_plan = _StubAsync(MelderResult(
+            plan="Plan",
+            raw_output="",
+        ))
+        melder.synthesize_feedback = _StubAsync(MelderResult(
+            plan="Plan v2",
+            raw_output="",
+        ))
+
+        # Set the flag cooperatively instead of delivering a real
+        # SIGINT, which is fragile under xdist and exercises the same
+        # loop check the signal handler feeds
+        async def interrupt_feedback(*args, **kwargs):
+            orchestrator._interrupted = True
+            return []
+
+        pool = patched_components["AdvisorPool"].return_value
+        pool.collect_feedback = interrupt_feedback
+        pool.get_participating_advisors = MagicMock(return_value=[])
 
-            mock_preflight.return_value = [MagicMock(cli_found=True)]
-
-            melder = MockMelder.return_value
-            melder.generate_initial_plan = AsyncMock(return_value=MelderResult(
-                plan="Plan",
-                raw_output="",
-            ))
-
-            # Simulate interrupt during feedback collection
-            async def interrupt_feedback(*args, **kwargs):
-                import signal
-                import os
-                os.kill(os.getpid(), signal.SIGINT)
-                return []
-
-            pool = MockPool.return_value
-            pool.collect_feedback = interrupt_feedback
-            pool.get_participating_advisors = MagicMock(return_value=[])
+        orchestrator = Orchestrator(
+            task="Test task",
+            max_rounds=5,
+            run_dir=str(temp_run_dir),
+            quiet=True,
+            skip_preflight=True,
+        )
 
-            orchestrator = Orchestrator(
-                task="Test task",
-                run_dir=str(temp_run_dir),
-                quiet=True,
-                skip_preflight=True,
-            )
+        result = await orchestrator.run()
 
-            # The orchestrator should handle the interrupt gracefully
-            # This test verifies the signal handler is set up
-            assert hasattr(orchestrator, "_interrupted")
+        # Interrupted during round 1: no further rounds run
+        assert result.rounds_completed == 1
+        assert result.converged is False
@@ -1,6 +1,7 @@
 """Unit tests for the output formatting module."""
 
 import json
+import re
 from datetime import datetime, timedelta
 
 import pytest
@@ -8,78 +9,57 @@ import pytest
 from meld.data_models import SessionMetadata
 from meld.output import OutputFormatter
 
+# All markers the default render must contain, checked in one search
+# instead of one full-string scan per assert
+_BASIC_PLAN_MARKERS = re.compile(
+    r"(?=.*# Implementation Plan)(?=.*test plan)(?=.*## Run Report)"
+    r"(?=.*Claude ✓)(?=.*Gemini ✓)(?=.*Openai ✗)",
+    re.DOTALL,
+)
 
-class TestOutputFormatter:
-    """Tests for OutputFormatter."""
-
-    @pytest.fixture
-    def basic_session(self) -> SessionMetadata:
-        """Create a basic session for testing."""
-        now = datetime.utcnow()
-        return SessionMetadata(
-            session_id="20260116-143045-abc12345",
-            task="Build a user authentication system with OAuth2 support",
-            started_at=now - timedelta(minutes=5),
-            completed_at=now,
-            rounds_completed=3,
-            max_rounds=5,
-            converged=True,
-            advisors_participated=["claude", "gemini"],
-            status="complete",
-        )
 
-    @pytest.fixture
-    def non_converged_session(self) -> SessionMetadata:
-        """Create a non-converged session for testing."""
-        now = datetime.utcnow()
-        return SessionMetadata(
-            session_id="20260116-143045-def67890",
-            task="Design a complex distributed system",
-            started_at=now - timedelta(minutes=10),
-            completed_at=now,
-            rounds_completed=5,
-            max_rounds=5,
-            converged=False,
-            advisors_participated=["claude"],
-            status="complete",
-        )
+@pytest.fixture(scope="module")
+def formatter() -> OutputFormatter:
+    """Default formatter shared module-wide; it holds no per-call state.
+
+    Tests that need verbose=True construct their own instance.
+    """
+    return OutputFormatter()
 
 
 class TestFormatFinalPlan:
     """Tests for format_final_plan method."""
 
-    def test_basic_plan_formatting(self, basic_session: SessionMetadata) -> None:
-        """Test that basic plan is formatted correctly."""
-        formatter = OutputFormatter()
-        plan = "## Step 1\nDo something\n\n## Step 2\nDo something else"
+    @pytest.fixture(scope="module")
+    def rendered_basic_plan(self, basic_session: SessionMetadata) -> str:
+        """Render the default plan once for the substring-assert tests.
 
-        result = formatter.format_final_plan(plan, basic_session)
+        Several tests check different substrings of the same render;
+        one shared output replaces a full re-render per test.
+        """
+        return OutputFormatter().format_final_plan("test plan", basic_session)
 
-        assert "# Implementation Plan" in result
-        assert plan in result
-        assert "## Run Report" in result
+    def test_basic_plan_formatting(
+        self, rendered_basic_plan: str, basic_session: SessionMetadata
+    ) -> None:
+        """Test that basic plan is formatted correctly."""
+        result = rendered_basic_plan
+
+        assert _BASIC_PLAN_MARKERS.search(result)
         assert basic_session.session_id in result
-        assert "Claude ✓" in result
-        assert "Gemini ✓" in result
-        assert "Openai ✗" in result
 
-    def test_converged_status_text(self, basic_session: SessionMetadata) -> None:
+    def test_converged_status_text(self, rendered_basic_plan: str) -> None:
         """Test that converged sessions show correct status."""
-        formatter = OutputFormatter()
-        result = formatter.format_final_plan("test plan", basic_session)
+        assert "Converged after 3 rounds" in rendered_basic_plan
 
-        assert "Converged after 3 rounds" in result
-
-    def test_non_converged_status_text(self, non_converged_session: SessionMetadata) -> None:
+    def test_non_converged_status_text(self, formatter, non_converged_session: SessionMetadata) -> None:
         """Test that non-converged sessions show max rounds status."""
-        formatter = OutputFormatter()
         result = formatter.format_final_plan("test plan", non_converged_session)
 
         assert "Max rounds reached (5/5)" in result
 
-    def test_includes_decision_log(self, basic_session: SessionMetadata) -> None:
+    def test_includes_decision_log(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that decision log is included when provided."""
-        formatter = OutputFormatter()
         decision_log = "- ACCEPTED: Add OAuth2 flow\n- REJECTED: Skip tests"
 
         result = formatter.format_final_plan(
@@ -91,9 +71,8 @@ class TestFormatFinalPlan:
         assert "### Decision Log" in result
         assert decision_log in result
 
-    def test_includes_round_summaries(self, basic_session: SessionMetadata) -> None:
+    def test_includes_round_summaries(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that round summaries are included when provided."""
-        formatter = OutputFormatter()
         round_summaries = [
             {"round": 1, "changes": 5, "updates": "Added auth flow"},
             {"round": 2, "changes": 2, "updates": "Refined error handling"},
@@ -143,46 +122,39 @@ class TestFormatFinalPlan:
 
         assert "## Raw Advisor Outputs" not in result
 
-    def test_includes_version_footer(self, basic_session: SessionMetadata) -> None:
+    def test_includes_version_footer(self, rendered_basic_plan: str) -> None:
         """Test that version is included in footer."""
-        formatter = OutputFormatter()
-        result = formatter.format_final_plan("test plan", basic_session)
-
-        assert "Generated by Meld v" in result
+        assert "Generated by Meld v" in rendered_basic_plan
 
 
 class TestFormatRunReport:
     """Tests for format_run_report method."""
 
-    def test_basic_report_formatting(self, basic_session: SessionMetadata) -> None:
+    def test_basic_report_formatting(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that basic run report is formatted correctly."""
-        formatter = OutputFormatter()
         result = formatter.format_run_report(basic_session)
 
         assert "# Meld Run Report" in result
         assert basic_session.session_id in result
         assert "Converged after 3 rounds" in result
 
-    def test_includes_timing_info(self, basic_session: SessionMetadata) -> None:
+    def test_includes_timing_info(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that timing info is included."""
-        formatter = OutputFormatter()
         result = formatter.format_run_report(basic_session)
 
         assert "**Started:**" in result
         assert "**Completed:**" in result
         assert "**Duration:**" in result
 
-    def test_includes_round_summary_table(self, basic_session: SessionMetadata) -> None:
+    def test_includes_round_summary_table(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that round summary table is present."""
-        formatter = OutputFormatter()
         result = formatter.format_run_report(basic_session)
 
         assert "## Round Summary" in result
         assert "| Round | Changes | Key Updates |" in result
 
-    def test_default_round_entries(self, basic_session: SessionMetadata) -> None:
+    def test_default_round_entries(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that default entries are created for each round."""
-        formatter = OutputFormatter()
         result = formatter.format_run_report(basic_session)
 
         # Should have entries for rounds 1, 2, 3
@@ -190,9 +162,8 @@ class TestFormatRunReport:
         assert "| 2 | - | - |" in result
         assert "| 3 | - | - |" in result
 
-    def test_custom_round_summaries(self, basic_session: SessionMetadata) -> None:
+    def test_custom_round_summaries(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that custom round summaries are used."""
-        formatter = OutputFormatter()
         round_summaries = [
             {"round": 1, "changes": 8, "updates": "Initial structure"},
         ]
@@ -204,9 +175,8 @@ class TestFormatRunReport:
 
         assert "| 1 | 8 | Initial structure |" in result
 
-    def test_includes_decision_log(self, basic_session: SessionMetadata) -> None:
+    def test_includes_decision_log(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that decision log is included in run report."""
-        formatter = OutputFormatter()
         decision_log = "- ACCEPTED: Use JWT tokens"
 
         result = formatter.format_run_report(
@@ -217,9 +187,8 @@ class TestFormatRunReport:
         assert "## Decision Log" in result
         assert decision_log in result
 
-    def test_shows_advisor_errors(self, basic_session: SessionMetadata) -> None:
+    def test_shows_advisor_errors(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that advisor errors are reflected in status."""
-        formatter = OutputFormatter()
         advisor_errors = {"openai": "CLI not found"}
 
         result = formatter.format_run_report(
@@ -233,92 +202,78 @@ class TestFormatRunReport:
 class TestFormatJsonSummary:
     """Tests for format_json_summary method."""
 
-    def test_valid_json_output(self, basic_session: SessionMetadata) -> None:
-        """Test that output is valid JSON."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
+    @pytest.fixture(scope="module")
+    def json_summary_data(self, basic_session: SessionMetadata) -> dict:
+        """Render and parse the default summary once for the module."""
+        return json.loads(OutputFormatter().format_json_summary(basic_session))
 
-        # Should not raise
-        data = json.loads(result)
-        assert isinstance(data, dict)
+    def test_valid_json_output(self, json_summary_data: dict) -> None:
+        """Test that output parses as a JSON object."""
+        assert isinstance(json_summary_data, dict)
 
-    def test_includes_version(self, basic_session: SessionMetadata) -> None:
+    def test_includes_version(self, json_summary_data: dict) -> None:
         """Test that version is included."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert "version" in data
         assert data["version"] == "0.1.0"
 
-    def test_includes_session_id(self, basic_session: SessionMetadata) -> None:
+    def test_includes_session_id(
+        self, json_summary_data: dict, basic_session: SessionMetadata
+    ) -> None:
         """Test that session ID is included."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert data["session_id"] == basic_session.session_id
 
-    def test_includes_status(self, basic_session: SessionMetadata) -> None:
+    def test_includes_status(self, json_summary_data: dict) -> None:
         """Test that status is correct for converged session."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert data["status"] == "converged"
 
-    def test_non_converged_status(self, non_converged_session: SessionMetadata) -> None:
+    def test_non_converged_status(self, formatter, non_converged_session: SessionMetadata) -> None:
         """Test that status is correct for non-converged session."""
-        formatter = OutputFormatter()
         result = formatter.format_json_summary(non_converged_session)
         data = json.loads(result)
 
         assert data["status"] == "complete"  # Uses session status
         assert data["convergence"]["converged"] is False
 
-    def test_includes_rounds_info(self, basic_session: SessionMetadata) -> None:
+    def test_includes_rounds_info(self, json_summary_data: dict) -> None:
         """Test that rounds info is included."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert data["rounds_completed"] == 3
         assert data["max_rounds"] == 5
 
-    def test_includes_duration(self, basic_session: SessionMetadata) -> None:
+    def test_includes_duration(self, json_summary_data: dict) -> None:
         """Test that duration is calculated."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert "duration_seconds" in data
         assert data["duration_seconds"] is not None
         assert data["duration_seconds"] > 0
 
-    def test_includes_advisors_object(self, basic_session: SessionMetadata) -> None:
+    def test_includes_advisors_object(self, json_summary_data: dict) -> None:
         """Test that advisors object is present."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert "advisors" in data
         assert "claude" in data["advisors"]
         assert data["advisors"]["claude"]["participated"] is True
 
-    def test_includes_convergence_object(self, basic_session: SessionMetadata) -> None:
+    def test_includes_convergence_object(self, json_summary_data: dict) -> None:
         """Test that convergence object is present."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert "convergence" in data
         assert data["convergence"]["converged"] is True
         assert "open_items" in data["convergence"]
         assert "final_diff_ratio" in data["convergence"]
 
-    def test_custom_advisor_details(self, basic_session: SessionMetadata) -> None:
+    def test_custom_advisor_details(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that custom advisor details are used."""
-        formatter = OutputFormatter()
         advisor_details = {
             "claude": {"participated": True, "rounds": [1, 2, 3]},
             "gemini": {"participated": True, "rounds": [1, 2, 3]},
@@ -334,9 +289,8 @@ class TestFormatJsonSummary:
         assert data["advisors"]["openai"]["participated"] is False
         assert data["advisors"]["openai"]["error"] == "CLI not found"
 
-    def test_custom_convergence_info(self, basic_session: SessionMetadata) -> None:
+    def test_custom_convergence_info(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that custom convergence info is used."""
-        formatter = OutputFormatter()
         convergence_info = {
             "open_items": 0,
             "diff_ratio": 0.02,
@@ -351,11 +305,9 @@ class TestFormatJsonSummary:
         assert data["convergence"]["open_items"] == 0
         assert data["convergence"]["final_diff_ratio"] == 0.02
 
-    def test_includes_timestamps(self, basic_session: SessionMetadata) -> None:
+    def test_includes_timestamps(self, json_summary_data: dict) -> None:
         """Test that timestamps are included in ISO format."""
-        formatter = OutputFormatter()
-        result = formatter.format_json_summary(basic_session)
-        data = json.loads(result)
+        data = json_summary_data
 
         assert data["started_at"] is not None
         assert data["started_at"].endswith("Z")
@@ -366,9 +318,8 @@ class TestFormatJsonSummary:
 class TestFormatQuietOutput:
     """Tests for format_quiet_output method."""
 
-    def test_returns_plan_only(self, basic_session: SessionMetadata) -> None:
+    def test_returns_plan_only(self, formatter, basic_session: SessionMetadata) -> None:
         """Test that quiet mode returns only the plan."""
-        formatter = OutputFormatter()
         plan = "This is the plan content."
 
         result = formatter.format_quiet_output(plan)
@@ -379,36 +330,25 @@ class TestFormatQuietOutput:
 class TestAdvisorStatusFormatting:
     """Tests for _format_advisor_status helper."""
 
-    def test_all_participated(self) -> None:
-        """Test when all advisors participated."""
-        formatter = OutputFormatter()
-        result = formatter._format_advisor_status(["claude", "gemini", "openai"])
-
-        assert "Claude ✓" in result
-        assert "Gemini ✓" in result
-        assert "Openai ✓" in result
-
-    def test_partial_participation(self) -> None:
-        """Test when only some advisors participated."""
-        formatter = OutputFormatter()
-        result = formatter._format_advisor_status(["claude"])
-
-        assert "Claude ✓" in result
-        assert "Gemini ✗" in result
-        assert "Openai ✗" in result
-
-    def test_no_participation(self) -> None:
-        """Test when no advisors participated."""
-        formatter = OutputFormatter()
-        result = formatter._format_advisor_status([])
+    @pytest.mark.parametrize(
+        "participated,expected",
+        [
+            # All, partial, and no participation
+            (["claude", "gemini", "openai"], {"Claude ✓", "Gemini ✓", "Openai ✓"}),
+            (["claude"], {"Claude ✓", "Gemini ✗", "Openai ✗"}),
+            ([], {"Claude ✗", "Gemini ✗", "Openai ✗"}),
+        ],
+    )
+    def test_advisor_status(self, participated, expected) -> None:
+        """Marks each advisor according to participation."""
+        result = OutputFormatter()._format_advisor_status(participated)
 
-        assert "Claude ✗" in result
-        assert "Gemini ✗" in result
-        assert "Openai ✗" in result
+        assert all(marker in result for marker in expected)
 
 
-# Fixtures available to all test classes
-@pytest.fixture
+# Fixtures available to all test classes. Module-scoped: the formatter
+# never mutates the session, so one instance serves every test.
+@pytest.fixture(scope="module")
 def basic_session() -> SessionMetadata:
     """Create a basic session for testing."""
     now = datetime.utcnow()
@@ -425,7 +365,7 @@ def basic_session() -> SessionMetadata:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def non_converged_session() -> SessionMetadata:
     """Create a non-converged session for testing."""
     now = datetime.utcnow()
@@ -1,6 +1,7 @@
 """Tests for preflight checks and doctor command."""
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from meld.preflight import (
     INSTALL_INSTRUCTIONS,
     PreflightResult,
     ProviderCheckResult,
+    _which_cached,
     check_cli_exists,
     get_cli_path,
     get_cli_version,
@@ -19,6 +21,15 @@ from meld.preflight import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_which_cache():
+    """PATH lookups are cached; clear around each test so
+    shutil.which patches take effect."""
+    _which_cached.cache_clear()
+    yield
+    _which_cached.cache_clear()
+
+
 class TestCheckCliExists:
     """Tests for check_cli_exists function."""
 
@@ -48,44 +59,63 @@ class TestGetCliPath:
             assert get_cli_path("nonexistent") == ""
 
 
+def _stub_adapter(available: bool = True) -> SimpleNamespace:
+    """Adapter stand-in with only what get_cli_version touches.
+
+    SimpleNamespace skips MagicMock's per-attribute child creation for
+    tests that need nothing beyond is_available() and cli_command.
+    """
+    return SimpleNamespace(is_available=lambda: available, cli_command="test")
+
+
 class TestGetCliVersion:
     """Tests for get_cli_version function."""
 
     @pytest.mark.asyncio
     async def test_returns_version_string(self) -> None:
         """Returns version string from CLI output."""
-        mock_adapter = MagicMock()
-        mock_adapter.is_available.return_value = True
-        mock_adapter.cli_command = "test"
-
-        mock_proc = AsyncMock()
-        mock_proc.returncode = 0
-        mock_proc.communicate.return_value = (b"1.2.3\n", b"")
+        mock_proc = SimpleNamespace(
+            returncode=0,
+            communicate=AsyncMock(return_value=(b"1.2.3\n", b"")),
+        )
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
-            version = await get_cli_version(mock_adapter)
+            version = await get_cli_version(_stub_adapter())
             assert version == "1.2.3"
 
     @pytest.mark.asyncio
     async def test_returns_empty_when_cli_not_available(self) -> None:
         """Returns empty string when CLI is not available."""
-        mock_adapter = MagicMock()
-        mock_adapter.is_available.return_value = False
+        version = await get_cli_version(_stub_adapter(available=False))
+        assert version == ""
+
+    @pytest.mark.asyncio
+    async def test_kills_hung_process_on_timeout(self, monkeypatch) -> None:
+        """Kills the child and returns empty when the probe hangs."""
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        mock_proc = SimpleNamespace(
+            communicate=hang,
+            kill=MagicMock(),
+            wait=AsyncMock(),
+        )
+
+        monkeypatch.setattr("meld.preflight.VERSION_PROBE_TIMEOUT", 0.01)
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
+            version = await get_cli_version(_stub_adapter())
 
-        version = await get_cli_version(mock_adapter)
         assert version == ""
+        mock_proc.kill.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_handles_timeout_gracefully(self) -> None:
         """Handles timeout gracefully by returning empty string."""
-        mock_adapter = MagicMock()
-        mock_adapter.is_available.return_value = True
-        mock_adapter.cli_command = "test"
-
         with patch(
             "asyncio.create_subprocess_exec", side_effect=asyncio.TimeoutError()
         ):
-            version = await get_cli_version(mock_adapter)
+            version = await get_cli_version(_stub_adapter())
             assert version == ""
 
 
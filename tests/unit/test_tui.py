@@ -25,7 +25,7 @@ class TestStreamBuffer:
         buffer = StreamBuffer()
         buffer.append("Hello ")
         buffer.append("World")
-        assert buffer._pending == "Hello World"
+        assert buffer.pending == "Hello World"
         assert buffer.content == ""
 
     def test_force_flush(self) -> None:
@@ -35,40 +35,40 @@ class TestStreamBuffer:
         result = buffer.force_flush()
         assert result == "Test content"
         assert buffer.content == "Test content"
-        assert buffer._pending == ""
+        assert buffer.pending == ""
 
     def test_clear(self) -> None:
         """Test clearing buffer."""
         buffer = StreamBuffer()
         buffer.content = "Old content"
-        buffer._pending = "Pending"
+        buffer.append("Pending")
         buffer.clear()
         assert buffer.content == ""
-        assert buffer._pending == ""
+        assert buffer.pending == ""
 
     def test_flush_respects_throttle(self) -> None:
         """Test that flush respects throttle interval."""
         buffer = StreamBuffer()
-        buffer._min_interval = 1.0  # 1 second interval
+        buffer._min_interval_ns = 1_000_000_000  # 1 second interval
 
         # First flush should work immediately after setting last_flush to 0
-        buffer._last_flush = 0.0
+        buffer._last_flush_ns = 0
         buffer.append("First")
 
-        # This should flush since last_flush is 0 and current time > 1.0
-        with patch("meld.tui._get_time", return_value=1.5):
+        # This should flush since last_flush is 0 and current time > 1s
+        with patch("meld.tui._get_time_ns", return_value=1_500_000_000):
             result = buffer.flush()
             assert result == "First"
 
     def test_flush_returns_none_when_throttled(self) -> None:
         """Test flush returns None when within throttle interval."""
         buffer = StreamBuffer()
-        buffer._min_interval = 1.0
+        buffer._min_interval_ns = 1_000_000_000
 
         # Set a recent last_flush
-        buffer._last_flush = 0.4  # Only 0.1 seconds ago
+        buffer._last_flush_ns = 400_000_000  # Only 0.1 seconds ago
 
-        with patch("meld.tui._get_time", return_value=0.5):
+        with patch("meld.tui._get_time_ns", return_value=500_000_000):
             buffer.append("Content")
             result = buffer.flush()
             assert result is None